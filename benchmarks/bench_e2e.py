@@ -0,0 +1,282 @@
+"""
+Offline end-to-end benchmarks: no live APIs, no Gmail.
+The ten job sources, Hunter and Telegram are served by a local HTTP stand-in, mail goes
+to a local SMTP sink, and applied histories are synthetic. Job sources answer from
+synthetic fixtures, or recorded ones (--record, then --fixtures). Hunter and Telegram
+answers are always synthetic (standin.py): recording them would spend Hunter credits and
+post to the chat, so their latency and payloads are not those of the live APIs.
+Reports latency, throughput and (with --tracemalloc) peak memory per part; --profile DIR
+dumps a cProfile file per part (read with pstats).
+
+    python -m benchmarks.bench_e2e [--parts match,discovery,state,e2e] [--postings 200]
+        [--history 1000,10000,100000,1000000] [--cap 10] [--tracemalloc] [--profile DIR] [--json OUT]
+    python -m benchmarks.bench_e2e --record DIR   # save live job-source responses as fixtures
+"""
+import os
+
+# Before config is imported: credentials the code checks for (nothing real is contacted),
+# no DNS pre-check, plain unauthenticated SMTP to the sink.
+for _name, _value in (
+    ("GMAIL_USER", "bench@example.com"),
+    ("GMAIL_APP_PASSWORD", "bench"),
+    ("HUNTER_API_KEY", "bench"),
+    ("TELEGRAM_BOT_TOKEN", "bench"),
+    ("TELEGRAM_CHAT_ID", "1"),
+    ("ADZUNA_APP_ID", "bench"),
+    ("ADZUNA_APP_KEY", "bench"),
+    ("THEMUSE_API_KEY", "bench"),
+    ("AUTHENTICJOBS_API_KEY", "bench"),
+    ("DNS_PRECHECK", "0"),
+    ("SMTP_STARTTLS", "0"),
+    ("SMTP_AUTH", "0"),
+):
+    os.environ.setdefault(_name, _value)
+
+import argparse  # noqa: E402
+import cProfile  # noqa: E402
+import json  # noqa: E402
+import logging  # noqa: E402
+import random  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+from datetime import datetime, timedelta  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+import config  # noqa: E402
+import run_agent  # noqa: E402
+from benchmarks import fixtures  # noqa: E402
+from benchmarks.bench_matcher import make_postings  # noqa: E402
+from benchmarks.standin import HttpStandIn, SmtpSink, route_http_client  # noqa: E402
+from src import disk_cache, http_client, job_discovery, metrics, state, telegram_notifier  # noqa: E402
+from src.models import Job  # noqa: E402
+
+LOOKUPS = 100_000
+APPENDS = 200
+
+
+class _Run:
+    """Times one part, optionally under cProfile and tracemalloc."""
+
+    def __init__(self, profile_dir: Path | None, trace: bool) -> None:
+        self.profile_dir = profile_dir
+        self.trace = trace
+
+    def __call__(self, name: str, fn, *args):
+        profiler = cProfile.Profile() if self.profile_dir else None
+        if self.trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            result = fn(*args)
+        finally:
+            if profiler:
+                profiler.disable()
+            seconds = time.perf_counter() - start
+            peak = None
+            if self.trace:
+                peak = tracemalloc.get_traced_memory()[1] / 2**20
+                tracemalloc.stop()
+        if profiler:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(self.profile_dir / f"{name}.prof")
+        return result, seconds, peak
+
+
+def _mib(peak: float | None) -> str:
+    return "-" if peak is None else f"{peak:.1f} MiB"
+
+
+def bench_match(run: _Run, n: int) -> dict:
+    postings = make_postings(n)
+    jobs = [(Job("bench", str(i), p["company_name"], p["title"], f"u{i}"), p) for i, p in enumerate(postings)]
+    hits, seconds, peak = run("match", lambda: sum(job_discovery._matches(j, p["tags"], p["description"]) for j, p in jobs))
+    print(f"match      {n} postings  {n / seconds:10.0f} postings/s  matches={hits}  peak {_mib(peak)}")
+    return {"postings": n, "seconds": seconds, "per_second": n / seconds, "matches": hits, "peak_mib": peak}
+
+
+def bench_discovery(run: _Run, standin: HttpStandIn, workdir: Path) -> dict:
+    disk_cache.relocate(workdir / "discovery-cache")
+    out = {}
+    for label in ("cold", "warm"):  # warm: conditional GETs answered 304 from the cache
+        standin.requests.clear()
+        jobs, seconds, peak = run(f"discovery_{label}", job_discovery.fetch_all_jobs)
+        not_modified = sum(n for k, n in standin.requests.items() if k.endswith("not_modified"))
+        print(
+            f"discovery  {label:5s} {len(jobs):6d} jobs in {seconds * 1000:7.1f} ms"
+            f"  ({len(jobs) / seconds:8.0f} jobs/s, {not_modified} not modified)  peak {_mib(peak)}"
+        )
+        out[label] = {"jobs": len(jobs), "seconds": seconds, "not_modified": not_modified, "peak_mib": peak}
+    return out
+
+
+def make_history(n: int, seed: int = 3) -> list[dict]:
+    """Synthetic applied.json records: ~2 applications per company, spread over two years."""
+    rnd = random.Random(seed)
+    now = datetime.utcnow()
+    sources = ("remoteok", "remotive", "jobicy", "workingnomads", "wwr")
+    records = []
+    for i in range(n):
+        company = rnd.randrange(max(1, n // 2))
+        records.append(
+            {
+                "source": sources[i % len(sources)],
+                "job_id": str(i),
+                "job_url": f"https://jobs.example/{i}",
+                "company": f"Company {company}",
+                "applied_at": (now - timedelta(minutes=rnd.randrange(2 * 365 * 24 * 60))).isoformat() + "Z",
+                "to_email": f"jobs@company{company}.com",
+            }
+        )
+    return records
+
+
+def bench_state(run: _Run, sizes: list[int], workdir: Path) -> dict:
+    out = {}
+    for n in sizes:
+        path = workdir / f"history-{n}" / "applied.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(make_history(n), f, indent=2)
+        index, load_s, peak = run(f"state_load_{n}", state.load_index, path)
+        urls = [f"https://jobs.example/{i * 2}" for i in range(LOOKUPS)]  # about half are hits for n >= 2 * LOOKUPS
+
+        def lookups():
+            hits = sum(index.contains(u, "remotive", u[-6:]) for u in urls)
+            hits += sum(state.is_applied(u, index) for u in urls)
+            hits += sum(index.recently_contacted(f"Company {i}") for i in range(LOOKUPS))
+            return hits
+
+        _, lookup_s, _ = run(f"state_lookup_{n}", lookups)
+
+        def appends():
+            for i in range(APPENDS):
+                state.append_applied("bench", f"new{i}", f"https://new.example/{i}", f"New {i}", index, path, "a@b.c")
+
+        # No automatic compaction inside appends(): "append" is the journal write alone, and the
+        # compact timed next folds all APPENDS records into the snapshot.
+        compact_every = config.STATE_COMPACT_EVERY
+        config.STATE_COMPACT_EVERY = APPENDS + 1
+        try:
+            _, append_s, _ = run(f"state_append_{n}", appends)
+        finally:
+            config.STATE_COMPACT_EVERY = compact_every
+        _, compact_s, _ = run(f"state_compact_{n}", state.compact, index, path)
+        ops = 3 * LOOKUPS
+        print(
+            f"state      {n:8d} records  load {load_s * 1000:8.1f} ms  lookups {ops / lookup_s:10.0f}/s"
+            f"  append {append_s / APPENDS * 1000:6.2f} ms  compact {compact_s * 1000:8.1f} ms  peak {_mib(peak)}"
+        )
+        out[n] = {
+            "load_seconds": load_s,
+            "lookups_per_second": ops / lookup_s,
+            "append_ms": append_s / APPENDS * 1000,
+            "compact_seconds": compact_s,
+            "load_peak_mib": peak,
+        }
+    return out
+
+
+def bench_e2e(run: _Run, standin: HttpStandIn, sink: SmtpSink, history: int, workdir: Path) -> dict:
+    """run_agent.main against the stand-ins; per-stage busy time and item counts from the pipeline."""
+    root = workdir / "e2e"
+    root.mkdir(parents=True, exist_ok=True)
+    run_agent.STATE_PATH = root / "applied.json"
+    run_agent.DISCOVERY_STATE_PATH = root / "discovery.json"
+    run_agent.HUNTER_BUDGET_PATH = root / "hunter_budget.json"
+    with open(run_agent.STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(make_history(history), f)
+    disk_cache.relocate(root / "cache")
+    config.METRICS_DIR = str(root / "metrics")
+    metrics.reset()
+    standin.requests.clear()
+    summary, seconds, peak = run("e2e", run_agent.main)
+    print(
+        f"e2e        {summary.get('applied', 0)} applied (cap {config.MAX_APPLICATIONS_PER_RUN}),"
+        f" {summary.get('discovered', 0)} jobs, history {history}: {seconds * 1000:.0f} ms  peak {_mib(peak)}"
+    )
+    stages = {}
+    for stage, busy in (summary.get("timings") or {}).items():
+        items = (summary.get("items") or {}).get(stage)
+        per_item = f"{busy / items * 1000:8.2f} ms/item  {items / busy if busy else 0:8.0f} items/s" if items else ""
+        print(f"  {stage:9s} {busy * 1000:9.1f} ms  {items if items is not None else '':>5}  {per_item}")
+        stages[stage] = {"seconds": busy, "items": items}
+    print(f"  smtp sink: {sink.messages} messages;  http: {dict(sorted(standin.requests.items()))}")
+    if summary.get("skipped"):
+        print(f"  skipped: {summary['skipped']}")
+    return {"seconds": seconds, "peak_mib": peak, "summary": summary, "stages": stages, "smtp_messages": sink.messages}
+
+
+def record(directory: Path) -> None:
+    """
+    Fetch every job-source endpoint live (as the source registry describes it) and save the raw
+    responses as fixtures (not Hunter or Telegram).
+    """
+    for url, params in fixtures.endpoints():
+        try:
+            r = http_client.get(url, params=params)
+            r.raise_for_status()
+        except Exception as e:
+            print(f"skip {url}: {e}")
+            continue
+        path = fixtures.save(directory, fixtures.key_for_url(url, params), r.content)
+        print(f"saved {path.name} ({len(r.content)} bytes)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--parts", default="match,discovery,state,e2e")
+    parser.add_argument("--postings", type=int, default=200, help="synthetic postings per source")
+    parser.add_argument("--history", default="1000,10000,100000,1000000", help="applied.json sizes for the state part")
+    parser.add_argument("--e2e-history", type=int, default=1000)
+    parser.add_argument("--cap", type=int, default=10)
+    parser.add_argument("--fixtures", type=Path, help="directory of recorded fixtures (override synthetic ones)")
+    parser.add_argument("--record", type=Path, help="save live source responses to this directory and exit")
+    parser.add_argument("--real-limits", action="store_true", help="keep the per-host rate limits")
+    parser.add_argument("--tracemalloc", action="store_true", help="report peak traced memory per part (slower)")
+    parser.add_argument("--profile", type=Path, help="write <part>.prof cProfile dumps here")
+    parser.add_argument("--json", type=Path, help="write results as JSON")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+    if args.record:
+        record(args.record)
+        return
+
+    parts = {p.strip() for p in args.parts.split(",") if p.strip()}
+    config.RATE_LIMITS = args.real_limits
+    telegram_notifier.BATCH_WINDOW = 0.05
+    config.MAX_APPLICATIONS_PER_RUN = args.cap
+    fx = fixtures.synthetic(args.postings)
+    if args.fixtures:
+        fx.update(fixtures.load_dir(args.fixtures))
+    standin = HttpStandIn(fx).start()
+    sink = SmtpSink().start()
+    config.SMTP_HOST, config.SMTP_PORT = "127.0.0.1", sink.port
+    route_http_client(standin.address)
+    run = _Run(args.profile, args.tracemalloc)
+    results: dict = {}
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+            workdir = Path(tmp)
+            if "match" in parts:
+                results["match"] = bench_match(run, 5000)
+            if "discovery" in parts:
+                results["discovery"] = bench_discovery(run, standin, workdir)
+            if "state" in parts:
+                sizes = [int(s) for s in args.history.split(",") if s.strip()]
+                results["state"] = bench_state(run, sizes, workdir)
+            if "e2e" in parts:
+                results["e2e"] = bench_e2e(run, standin, sink, args.e2e_history, workdir)
+    finally:
+        standin.stop()
+        sink.stop()
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, default=str), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
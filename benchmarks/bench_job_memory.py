@@ -0,0 +1,148 @@
+"""
+Memory benchmark: parsing large Working Nomads / RemoteOK dumps into job records.
+Compares the old pipeline (r.json() on the whole body, a {**item, ...} copy per posting for
+matching, then a normalized dict) with the current one (streamed array, slotted Job
+records), by tracemalloc peak and retained size. Run with two sizes to see the current
+peak stay flat while the old one grows with the feed.
+
+    python -m benchmarks.bench_job_memory [--postings 20000]
+"""
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from functools import partial
+
+from benchmarks.bench_matcher import TITLES, WORDS
+from src import job_discovery, sources
+
+
+class _Response:
+    """Just enough of requests.Response for the parse functions."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+
+def make_working_nomads(n: int, seed: int = 7) -> bytes:
+    rnd = random.Random(seed)
+    items = []
+    for i in range(n):
+        items.append(
+            {
+                "url": f"https://www.workingnomads.com/jobs/{i}",
+                "title": rnd.choice(TITLES),
+                "company_name": f"Company {i}",
+                "tags": ",".join(rnd.sample(WORDS, 4)),
+                "description": " ".join(rnd.choice(WORDS) for _ in range(300)),
+                "pub_date": "2026-10-01T12:00:00+00:00",
+            }
+        )
+    return json.dumps(items).encode()
+
+
+def make_remoteok(n: int, seed: int = 11) -> bytes:
+    rnd = random.Random(seed)
+    items = [{"legal": "metadata"}]
+    for i in range(n):
+        items.append(
+            {
+                "id": str(100000 + i),
+                "url": f"https://remoteok.com/remote-jobs/{i}",
+                "position": rnd.choice(TITLES),
+                "company": f"Company {i}",
+                "tags": rnd.sample(WORDS, 5),
+                "description": " ".join(rnd.choice(WORDS) for _ in range(300)),
+                "epoch": 1790000000 + i,
+            }
+        )
+    return json.dumps(items).encode()
+
+
+def _legacy_matches(job: dict) -> bool:
+    title = job.get("position") or ""
+    other_title = job.get("title") or ""
+    if other_title and other_title != title:
+        title = f"{title} {other_title}"
+    company = job.get("company") or job.get("company_name") or ""
+    return job_discovery.MATCHER.matches(
+        {
+            "title": title,
+            "tags": job.get("tags") or (),
+            "company": company if isinstance(company, str) else "",
+            "description": job.get("description") or job.get("summary") or "",
+        }
+    )
+
+
+def _legacy_normalize(source, job_id, company, position, url, published) -> dict:
+    return {
+        "source": source,
+        "id": str(job_id),
+        "company": (company or "").strip(),
+        "position": (position or "").strip(),
+        "url": url.strip(),
+        "published": job_discovery._iso_date(published),
+    }
+
+
+def legacy_working_nomads(r) -> list[dict]:
+    """The dict-based parser, kept here as the baseline."""
+    jobs = []
+    for item in r.json():
+        url = (item.get("url") or "").strip()
+        norm = _legacy_normalize("workingnomads", url, item.get("company_name", ""), item.get("title", ""), url, item.get("pub_date"))
+        desc = (item.get("description") or "").lower()
+        if _legacy_matches({**item, "position": item.get("title"), "description": desc}):
+            jobs.append(norm)
+    return jobs
+
+
+def legacy_remoteok(r) -> list[dict]:
+    jobs = []
+    for item in r.json()[1:]:
+        url = (item.get("url") or "").strip()
+        norm = _legacy_normalize(
+            "remoteok", item.get("id", ""), item.get("company", ""), item.get("position", ""), url, item.get("epoch")
+        )
+        if _legacy_matches({**item, "title": item.get("position"), "tags": item.get("tags") or []}):
+            jobs.append(norm)
+    return jobs
+
+
+def _measure(parse, payload: bytes) -> tuple[int, float, float]:
+    gc.collect()
+    tracemalloc.start()
+    jobs = parse(_Response(payload))
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(jobs), peak / 2**20, retained / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--postings", type=int, default=20000)
+    args = parser.parse_args()
+
+    cases = (
+        ("Working Nomads", make_working_nomads(args.postings), legacy_working_nomads,
+         partial(job_discovery._parse, sources.load("workingnomads"))),
+        ("RemoteOK", make_remoteok(args.postings), legacy_remoteok, partial(job_discovery._parse, sources.load("remoteok"))),
+    )
+    for name, payload, legacy, current in cases:
+        print(f"{name}: {args.postings} postings, {len(payload) / 2**20:.1f} MiB payload")
+        for label, parse in (("r.json()+dict", legacy), ("streamed Job", current)):
+            count, peak, retained = _measure(parse, payload)
+            print(f"  {label:13s} peak {peak:8.1f} MiB  retained {retained:7.2f} MiB  jobs={count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark: keyword matcher throughput on synthetic postings shaped like the
+Working Nomads dump (title, company, tags, ~3 KB HTML description), for the matcher alone
+and for job_discovery._matches (threshold check plus the ranking score of matching jobs).
+
+    python -m benchmarks.bench_matcher [--postings 5000] [--repeat 3]
+"""
+import argparse
+import random
+import time
+
+import config
+from src import job_discovery
+from src.keyword_matcher import KeywordMatcher
+from src.models import Job
+
+WORDS = (
+    "team remote product customer platform data cloud python golang react typescript kotlin "
+    "javascript node aws kubernetes docker senior engineer developer scale design api service "
+    "billing growth marketing sales support analytics mobile ios android rust elixir ruby rails"
+).split()
+TITLES = (
+    "Senior Java Engineer", "Spring Boot Developer", "Frontend Engineer (React)",
+    "JavaScript Developer", "Backend Engineer, Payments", "Product Designer",
+    "Data Engineer", "DevOps Engineer", "Full-stack Developer", "Customer Success Manager",
+)
+
+
+def make_postings(n: int, seed: int = 7) -> list[dict]:
+    rnd = random.Random(seed)
+    postings = []
+    for i in range(n):
+        paragraphs = []
+        for _ in range(6):
+            paragraphs.append("<p>" + " ".join(rnd.choice(WORDS) for _ in range(80)) + "</p>")
+        postings.append(
+            {
+                "title": rnd.choice(TITLES),
+                "company_name": f"Company {i}",
+                "tags": rnd.sample(WORDS, 4),
+                "description": "\n".join(paragraphs),
+            }
+        )
+    return postings
+
+
+def naive_matches(job: dict, keywords: tuple[str, ...]) -> bool:
+    """The original substring filter, kept here as the baseline."""
+    text = " ".join(str(job.get(k, "")) for k in ("position", "title", "company", "company_name")).lower()
+    desc = (job.get("description") or job.get("summary") or "").lower()
+    tags = " ".join(job.get("tags") or []).lower()
+    combined = f"{text} {desc} {tags}"
+    return any(kw in combined for kw in keywords)
+
+
+def compiled_matches(job: dict, matcher: KeywordMatcher) -> bool:
+    return matcher.matches(
+        {
+            "title": job.get("title") or "",
+            "tags": job.get("tags") or (),
+            "company": job.get("company_name") or "",
+            "description": job.get("description") or "",
+        }
+    )
+
+
+def _time(fn, postings: list[dict], repeat: int) -> tuple[float, int]:
+    best, hits = float("inf"), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = sum(1 for p in postings if fn(p))
+        best = min(best, time.perf_counter() - start)
+    return best, hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--postings", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    postings = make_postings(args.postings)
+    matcher = KeywordMatcher(config.JOB_KEYWORDS, config.JOB_NEGATIVE_KEYWORDS, config.JOB_FIELD_WEIGHTS)
+    start = time.perf_counter()
+    KeywordMatcher(config.JOB_KEYWORDS, config.JOB_NEGATIVE_KEYWORDS)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    naive_s, naive_hits = _time(lambda p: naive_matches(p, config.JOB_KEYWORDS), postings, args.repeat)
+    compiled_s, compiled_hits = _time(lambda p: compiled_matches(p, matcher), postings, args.repeat)
+    # What discovery runs: the threshold check, then the full ranking score for jobs that pass.
+    jobs = [
+        (Job("bench", str(i), p["company_name"], p["title"], f"https://bench.example/{i}"), p["tags"], p["description"])
+        for i, p in enumerate(postings)
+    ]
+    discovery_s, discovery_hits = _time(lambda j: job_discovery._matches(*j), jobs, args.repeat)
+    print(f"postings: {len(postings)}  (matcher compile: {compile_ms:.2f} ms)")
+    print(f"substring any(): {len(postings) / naive_s:10.0f} postings/s  matches={naive_hits}")
+    print(f"compiled regex:  {len(postings) / compiled_s:10.0f} postings/s  matches={compiled_hits}")
+    print(f"discovery filter:{len(postings) / discovery_s:10.0f} postings/s  matches={discovery_hits}  (with scoring)")
+    print("(the substring filter also counts 'javascript' as 'java'; the compiled matcher does not)")
+
+
+if __name__ == "__main__":
+    main()
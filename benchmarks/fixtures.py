@@ -0,0 +1,186 @@
+"""
+Fixtures for the offline benchmarks: responses for the ten job sources, keyed by
+"host/path[?query]" as the stand-in server looks them up.
+
+Synthetic payloads are shaped like each source's real response (the fields the parsers
+in src/job_discovery.py read). Recorded ones, saved with
+`python -m benchmarks.bench_e2e --record DIR` from the live APIs, take precedence when
+passed with --fixtures DIR.
+"""
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit
+from xml.sax.saxutils import escape
+
+import config
+from benchmarks.bench_matcher import TITLES, WORDS
+from src import sources
+
+
+@lru_cache(maxsize=None)
+def _secret_params() -> frozenset[str]:
+    """Query parameters that carry credentials (any spec's secret_params): never part of a fixture key or file name."""
+    return frozenset(p for name in sources.REGISTRY for p in sources.load(name).secret_params)
+
+
+def endpoints() -> list[tuple[str, dict]]:
+    """
+    Live requests (URL, params) that job_discovery.fetch_source makes, one per URL and page,
+    for every registered source whose required keys are set. For --record.
+    """
+    out = []
+    for name in sources.REGISTRY:
+        spec = sources.load(name)
+        if not spec.configured():
+            continue
+        params = {**spec.params, **{p: getattr(config, attr) for p, attr in spec.secret_params.items()}}
+        for url in spec.urls:
+            for page in range(1, spec.pages + 1):
+                out.append((url, {**params, spec.page_param: page} if spec.page_param else params))
+    return out
+
+
+def fixture_key(host: str, path: str, query: str = "") -> str:
+    """"host/path?query" with secret parameters dropped and the rest sorted."""
+    secret = _secret_params()
+    params = sorted((k, v) for k, v in parse_qsl(query) if k not in secret)
+    key = f"{host}{path}"
+    return f"{key}?{urlencode(params)}" if params else key
+
+
+def key_for_url(url: str, params: dict | None = None) -> str:
+    parts = urlsplit(url)
+    query = "&".join(filter(None, [parts.query, urlencode(params or {})]))
+    return fixture_key(parts.netloc, parts.path, query)
+
+
+class _Postings:
+    """Deterministic postings: a share of matching titles, companies that repeat across sources."""
+
+    def __init__(self, seed: int) -> None:
+        self.rnd = random.Random(seed)
+        self.now = datetime.now(timezone.utc)
+
+    def make(self, n: int, prefix: str) -> list[dict]:
+        rnd = self.rnd
+        postings = []
+        for i in range(n):
+            company = rnd.randrange(max(1, n * 3))
+            postings.append(
+                {
+                    "id": f"{prefix}{i}",
+                    "title": rnd.choice(TITLES),
+                    "company": f"Company {company}",
+                    "url": f"https://{prefix}.example/jobs/{i}",
+                    "tags": rnd.sample(WORDS, 4),
+                    "description": " ".join(rnd.choice(WORDS) for _ in range(120)),
+                    "published": self.now - timedelta(hours=rnd.randrange(24 * 30)),
+                }
+            )
+        return postings
+
+
+def iso(posting: dict) -> str:
+    return posting["published"].strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _json(data) -> tuple[str, bytes]:
+    return "application/json", json.dumps(data).encode()
+
+
+def _rss(items: list[dict], company_in_title: bool) -> tuple[str, bytes]:
+    out = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>jobs</title>']
+    for p in items:
+        title = f"{p['company']}: {p['title']}" if company_in_title else p["title"]
+        out.append(
+            f"<item><title>{escape(title)}</title><link>{escape(p['url'])}</link>"
+            f"<pubDate>{format_datetime(p['published'])}</pubDate>"
+            f"<description>{escape(p['description'])}</description></item>"
+        )
+    out.append("</channel></rss>")
+    return "application/rss+xml", "".join(out).encode()
+
+
+def synthetic(postings: int = 200, seed: int = 7) -> dict[str, tuple[str, bytes]]:
+    """Responses for every source endpoint, `postings` jobs each (split over pages/feeds)."""
+    gen = _Postings(seed)
+    fx: dict[str, tuple[str, bytes]] = {}
+
+    items = gen.make(postings, "remoteok")
+    fx["remoteok.com/api"] = _json(
+        [{"legal": "metadata"}]
+        + [
+            {"id": p["id"], "url": p["url"], "company": p["company"], "position": p["title"], "tags": p["tags"],
+             "description": p["description"], "epoch": int(p["published"].timestamp())}
+            for p in items
+        ]
+    )
+    items = gen.make(postings, "remotive")
+    fx["remotive.com/api/remote-jobs"] = _json(
+        {"jobs": [{"id": p["id"], "url": p["url"], "company_name": p["company"], "title": p["title"], "tags": p["tags"],
+                   "description": p["description"], "publication_date": iso(p)} for p in items]}
+    )
+    items = gen.make(postings, "jobicy")
+    fx["jobicy.com/api/v2/remote-jobs"] = _json(
+        {"jobs": [{"id": p["id"], "url": p["url"], "companyName": p["company"], "jobTitle": p["title"],
+                   "pubDate": iso(p).replace("T", " ")} for p in items]}
+    )
+    items = gen.make(postings, "workingnomads")
+    fx["www.workingnomads.com/api/exposed_jobs/"] = _json(
+        [{"url": p["url"], "title": p["title"], "company_name": p["company"], "tags": ",".join(p["tags"]),
+          "description": p["description"], "pub_date": iso(p) + "+00:00"} for p in items]
+    )
+    items = gen.make(postings, "jobscollider")
+    fx["jobscollider.com/api/search-jobs"] = _json(
+        {"jobs": [{"id": p["id"], "url": p["url"], "company_name": p["company"], "title": p["title"],
+                   "published_at": iso(p) + "Z"} for p in items]}
+    )
+    items = gen.make(postings, "wwr")
+    half = len(items) // 2
+    fx["weworkremotely.com/categories/remote-programming-jobs.rss"] = _rss(items[:half], True)
+    fx["weworkremotely.com/categories/remote-back-end-programming-jobs.rss"] = _rss(items[half:], True)
+    for country in ("gb", "us"):
+        items = gen.make(postings // 2, f"adzuna{country}")
+        fx[f"api.adzuna.com/v1/api/jobs/{country}/search/1"] = _json(
+            {"results": [{"id": p["id"], "redirect_url": p["url"], "company": {"display_name": p["company"]},
+                          "title": p["title"], "description": p["description"], "created": iso(p) + "Z"} for p in items]}
+        )
+    for page in (1, 2, 3):
+        items = gen.make(postings // 3, f"themuse{page}")
+        fx[f"www.themuse.com/api/public/jobs?page={page}"] = _json(
+            {"results": [{"id": p["id"], "refs": {"landing_page": p["url"]}, "company": {"name": p["company"]},
+                          "name": p["title"], "publication_date": iso(p) + "Z"} for p in items]}
+        )
+    items = gen.make(postings, "rwfa")
+    third = len(items) // 3
+    fx["www.realworkfromanywhere.com/rss.xml"] = _rss(items[:third], False)
+    fx["www.realworkfromanywhere.com/remote-developer-jobs/rss.xml"] = _rss(items[third : 2 * third], False)
+    fx["www.realworkfromanywhere.com/remote-backend-jobs/rss.xml"] = _rss(items[2 * third :], False)
+    items = gen.make(postings, "authenticjobs")
+    fx["authenticjobs.com/api/posts/search/"] = _json(
+        {"listings": [{"id": p["id"], "url": p["url"], "company": {"name": p["company"]}, "title": p["title"],
+                       "post_date": iso(p)} for p in items]}
+    )
+    return fx
+
+
+def load_dir(directory: Path) -> dict[str, tuple[str, bytes]]:
+    """Recorded fixtures: one file per response, named by its quoted fixture key."""
+    fx = {}
+    for path in sorted(directory.glob("*")):
+        if path.is_file():
+            body = path.read_bytes()
+            kind = "application/rss+xml" if body.lstrip()[:1] == b"<" else "application/json"
+            fx[unquote(path.name)] = (kind, body)
+    return fx
+
+
+def save(directory: Path, key: str, body: bytes) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / quote(key, safe="")
+    path.write_bytes(body)
+    return path
@@ -0,0 +1,206 @@
+"""
+Local stand-ins for everything the agent talks to, for offline benchmarks:
+- an HTTP server answering the job sources (from fixtures), Hunter domain-search and
+  email-verifier, and the Telegram Bot API, routed by the Host header;
+- an SMTP sink accepting EHLO/MAIL/RCPT/DATA without auth or TLS.
+route_http_client() points src.http_client's shared session at the HTTP stand-in, so
+the code under test keeps its real URLs.
+"""
+import hashlib
+import json
+import socketserver
+import threading
+import zlib
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from requests.adapters import HTTPAdapter
+
+from benchmarks.fixtures import fixture_key
+from src import http_client
+
+
+class _HttpHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "HttpStandIn"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _reply(self, status: int, body: bytes = b"", content_type: str = "application/json", headers=None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        host = (self.headers.get("Host") or "").split(":")[0]
+        parts = urlsplit(self.path)
+        self.server.count(host)
+        if host == "api.hunter.io":
+            self._reply(200, json.dumps(self.server.hunter(parts.path, parse_qs(parts.query))).encode())
+            return
+        fixture = self.server.fixtures.get(fixture_key(host, parts.path, parts.query))
+        if fixture is None:
+            fixture = self.server.fixtures.get(fixture_key(host, parts.path))
+        if fixture is None:
+            self._reply(404, b'{"error": "no fixture"}')
+            return
+        content_type, body = fixture
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.server.count(host, "not_modified")
+            self._reply(304, headers={"ETag": etag})
+            return
+        self._reply(200, body, content_type, {"ETag": etag})
+
+    def do_POST(self) -> None:
+        host = (self.headers.get("Host") or "").split(":")[0]
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.count(host)
+        if self.path.endswith("/sendMessage"):
+            self._reply(200, b'{"ok": true, "result": {}}')
+        else:
+            self._reply(404, b'{"ok": false}')
+
+
+class HttpStandIn(ThreadingHTTPServer):
+    """
+    fixtures: {"host/path[?query]": (content_type, body)}. Hunter finds an address for
+    `hunter_hit_rate` of domains (deterministic per domain) and verifies most as valid.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, fixtures: dict[str, tuple[str, bytes]], hunter_hit_rate: float = 0.6) -> None:
+        super().__init__(("127.0.0.1", 0), _HttpHandler)
+        self.fixtures = fixtures
+        self.hunter_hit_rate = hunter_hit_rate
+        self.requests: Counter = Counter()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, name="http-standin", daemon=True)
+
+    @property
+    def address(self) -> str:
+        return f"127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "HttpStandIn":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def count(self, host: str, what: str = "requests") -> None:
+        with self._lock:
+            self.requests[f"{host} {what}"] += 1
+
+    def _hit(self, value: str, rate: float) -> bool:
+        return zlib.crc32(value.encode()) % 1000 < rate * 1000
+
+    def hunter(self, path: str, query: dict) -> dict:
+        if path.endswith("/account"):
+            # Plenty of credits, resetting tomorrow: the budget planner stays out of the way of the timings.
+            plenty = {"used": 0, "available": 1_000_000}
+            reset = (date.today() + timedelta(days=1)).isoformat()
+            return {"data": {"reset_date": reset, "requests": {"searches": plenty, "verifications": plenty}}}
+        if path.endswith("/domain-search"):
+            domain = (query.get("domain") or [""])[0]
+            if not self._hit(domain, self.hunter_hit_rate):
+                return {"data": {"domain": domain, "emails": []}}
+            return {"data": {"domain": domain, "emails": [{"value": f"ceo@{domain}"}, {"value": f"jobs@{domain}"}]}}
+        email = (query.get("email") or [""])[0]
+        return {"data": {"email": email, "status": "valid" if self._hit(email, 0.9) else "invalid"}}
+
+
+class _StandInAdapter(HTTPAdapter):
+    """Send every request to the stand-in, keeping the original host in the Host header."""
+
+    def __init__(self, address: str) -> None:
+        super().__init__(pool_maxsize=16)
+        self.address = address
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.headers["Host"] = parts.netloc
+        request.url = urlunsplit(("http", self.address, parts.path, parts.query, ""))
+        return super().send(request, **kwargs)
+
+
+def route_http_client(address: str) -> None:
+    """Route the shared http_client session (all hosts, http and https) to the stand-in."""
+    session = http_client.session()
+    session.adapters.clear()
+    adapter = _StandInAdapter(address)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    server: "SmtpSink"
+
+    def _send(self, line: bytes) -> None:
+        self.wfile.write(line + b"\r\n")
+
+    def handle(self) -> None:
+        self._send(b"220 smtp-sink ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line[:4].upper()
+            if verb in (b"EHLO", b"HELO"):
+                self._send(b"250-smtp-sink")
+                self._send(b"250 PIPELINING")
+            elif verb == b"DATA":
+                self._send(b"354 end with <CRLF>.<CRLF>")
+                size = 0
+                for data in iter(self.rfile.readline, b""):
+                    if data == b".\r\n":
+                        break
+                    size += len(data)
+                self.server.received(size)
+                self._send(b"250 queued")
+            elif verb == b"QUIT":
+                self._send(b"221 bye")
+                return
+            else:
+                self._send(b"250 ok")
+
+
+class SmtpSink(socketserver.ThreadingTCPServer):
+    """Accepts and counts messages (no auth, no TLS: run with SMTP_STARTTLS=0 and SMTP_AUTH=0)."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _SmtpHandler)
+        self.messages = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, name="smtp-sink", daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> "SmtpSink":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def received(self, size: int) -> None:
+        with self._lock:
+            self.messages += 1
+            self.bytes += size
@@ -9,16 +9,79 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def _env_int(name: str, default: int) -> int:
+    """Read a non-negative int from env, falling back to default."""
+    raw = (os.environ.get(name) or "").strip()
+    return int(raw) if raw.isdigit() else default
+
+
+def _env_list(name: str, default: str) -> tuple[str, ...]:
+    """Comma-separated lowercase values; an empty variable means an empty list."""
+    raw = os.environ.get(name)
+    raw = default if raw is None else raw
+    return tuple(s.strip().lower() for s in raw.split(",") if s.strip())
+
+
+def _env_weights(name: str, default: str) -> dict[str, int]:
+    """"name:weight,..." pairs; entries without a numeric weight are ignored."""
+    weights = {}
+    for pair in _env_list(name, default):
+        key, _, weight = pair.partition(":")
+        if key.strip() and weight.strip().isdigit():
+            weights[key.strip()] = int(weight)
+    return weights
+
+
 # Required for sending emails
 GMAIL_USER = os.environ.get("GMAIL_USER", "").strip()
 GMAIL_APP_PASSWORD = os.environ.get("GMAIL_APP_PASSWORD", "").strip()
 
+# SMTP server (Gmail by default; point at a local stand-in for testing, SMTP_STARTTLS=0 for plain
+# and SMTP_AUTH=0 for a server that takes mail without login)
+SMTP_HOST = (os.environ.get("SMTP_HOST") or "smtp.gmail.com").strip()
+SMTP_PORT = _env_int("SMTP_PORT", 587)
+SMTP_STARTTLS = (os.environ.get("SMTP_STARTTLS") or "1").strip() != "0"
+SMTP_AUTH = (os.environ.get("SMTP_AUTH") or "1").strip() != "0"
+SMTP_TIMEOUT = _env_int("SMTP_TIMEOUT", 30)
+
 # Optional: Hunter.io for finding real company emails (fallback: guess jobs@domain)
 HUNTER_API_KEY = os.environ.get("HUNTER_API_KEY", "").strip()
 
+# Hunter domain-search cache (data/cache/hunter_domains.json): days to keep found / not-found results
+HUNTER_CACHE_TTL_DAYS = _env_int("HUNTER_CACHE_TTL_DAYS", 30)
+HUNTER_NEGATIVE_TTL_DAYS = _env_int("HUNTER_NEGATIVE_TTL_DAYS", 7)
+HUNTER_CACHE_MAX_ENTRIES = _env_int("HUNTER_CACHE_MAX_ENTRIES", 5000)
+# Hunter verifier cache: days to keep valid/accept_all/invalid results, and 'unknown' results
+VERIFY_CACHE_TTL_DAYS = _env_int("VERIFY_CACHE_TTL_DAYS", 30)
+VERIFY_UNKNOWN_TTL_DAYS = _env_int("VERIFY_UNKNOWN_TTL_DAYS", 1)
+# Shared Hunter API rate limit (all lookups and verifications)
+HUNTER_REQUESTS_PER_MINUTE = max(1, _env_int("HUNTER_REQUESTS_PER_MINUTE", 40))
+# Concurrent Hunter domain lookups (candidate domains of a company are searched in parallel)
+HUNTER_LOOKUP_WORKERS = max(1, _env_int("HUNTER_LOOKUP_WORKERS", 6))
+# Credit budget (data/hunter_budget.json): spread the monthly Hunter quota over the days left
+# until it resets, best jobs and most likely domains first. Monthly quotas are used when the
+# account endpoint cannot be read. HUNTER_BUDGET=0 spends first come, first served.
+HUNTER_BUDGET = (os.environ.get("HUNTER_BUDGET") or "1").strip() != "0"
+HUNTER_MONTHLY_SEARCHES = _env_int("HUNTER_MONTHLY_SEARCHES", 25)
+HUNTER_MONTHLY_VERIFICATIONS = _env_int("HUNTER_MONTHLY_VERIFICATIONS", 50)
+
+# DNS pre-check: drop candidate domains with no MX/A record before any Hunter call.
+# DNS_NAMESERVERS is an optional comma-separated "host[:port]" list (default: system resolver).
+DNS_PRECHECK = (os.environ.get("DNS_PRECHECK") or "1").strip() != "0"
+DNS_NAMESERVERS = [s.strip() for s in os.environ.get("DNS_NAMESERVERS", "").split(",") if s.strip()]
+DNS_NEGATIVE_TTL = _env_int("DNS_NEGATIVE_TTL", 3600)
+
 # Optional: Telegram report after each application
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "").strip()
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "").strip()
+# Bot API base URL (override to point at a local stand-in when testing)
+TELEGRAM_API_BASE = (os.environ.get("TELEGRAM_API_BASE") or "https://api.telegram.org").strip().rstrip("/")
+
+# Run metrics: metrics.json and a Prometheus textfile (metrics.prom) written here; "off" disables
+METRICS_DIR = (os.environ.get("METRICS_DIR") or str(Path(__file__).resolve().parent / "data" / "metrics")).strip()
+if METRICS_DIR.lower() == "off":
+    METRICS_DIR = ""
 
 # Portfolio and motivation letter
 PORTFOLIO_URL = os.environ.get(
@@ -26,8 +89,58 @@ PORTFOLIO_URL = os.environ.get(
 ).strip()
 
 # Cap applications per run (default 10)
-_raw = (os.environ.get("MAX_APPLICATIONS_PER_RUN") or "10").strip()
-MAX_APPLICATIONS_PER_RUN = int(_raw) if _raw.isdigit() else 10
+MAX_APPLICATIONS_PER_RUN = _env_int("MAX_APPLICATIONS_PER_RUN", 10)
+
+# Shared HTTP client: timeouts in seconds, retries on 429/5xx (Retry-After honoured)
+HTTP_CONNECT_TIMEOUT = _env_int("HTTP_CONNECT_TIMEOUT", 5)
+HTTP_READ_TIMEOUT = _env_int("HTTP_READ_TIMEOUT", 30)
+HTTP_RETRIES = _env_int("HTTP_RETRIES", 3)
+# Per-host rate limits (src/rate_limit.py); RATE_LIMITS=0 turns them all off, for local stand-ins only
+RATE_LIMITS = (os.environ.get("RATE_LIMITS") or "1").strip() != "0"
+
+# Applied-state storage: "json" (data/applied.json + journal) or "sqlite" (data/applied.db)
+STATE_BACKEND = (os.environ.get("STATE_BACKEND") or "json").strip().lower()
+
+# Applied-state journal: fold data/applied.jsonl into applied.json every N records
+STATE_COMPACT_EVERY = max(1, _env_int("STATE_COMPACT_EVERY", 50))
+
+# Job filter: comma-separated keywords (word-boundary match), negative keywords that must not
+# count as a match (e.g. "javascript" is not "java"), and per-field weights "field:weight,...".
+JOB_KEYWORDS = _env_list("JOB_KEYWORDS", "spring boot,springboot,java,backend")
+JOB_NEGATIVE_KEYWORDS = _env_list("JOB_NEGATIVE_KEYWORDS", "javascript,java script")
+JOB_FIELD_WEIGHTS = _env_weights("JOB_FIELD_WEIGHTS", "title:3,tags:2,company:1,description:1")
+
+# Rank discovered jobs and keep the best MAX_APPLICATIONS_PER_RUN x this many (the expected
+# number of candidates per successful application); they are fed best first once discovery
+# ends. 0 = no ranking: jobs are fed in discovery order as each source finishes.
+RANK_TOP_K_FACTOR = max(0, _env_int("RANK_TOP_K_FACTOR", 3))
+
+# Job sources to fetch (names in src/sources REGISTRY); sources left out are never imported
+JOB_SOURCES = _env_list(
+    "JOB_SOURCES",
+    "remoteok,remotive,jobicy,workingnomads,jobscollider,wwr,adzuna,themuse,realworkfromanywhere,authenticjobs",
+)
+
+# Job sources fetched in parallel (1 = one after another)
+DISCOVERY_WORKERS = _env_int("DISCOVERY_WORKERS", 10)
+
+# Days to keep a source's ETag/Last-Modified and parsed jobs for conditional GETs
+SOURCE_CACHE_TTL_DAYS = _env_int("SOURCE_CACHE_TTL_DAYS", 7)
+
+# Days after an application during which the same company (or recipient email) is not written to again
+CONTACT_COOLDOWN_DAYS = max(0, _env_int("CONTACT_COOLDOWN_DAYS", 30))
+
+# Days before a job skipped as a dead end (no company / no email / not deliverable) is retried
+REJECT_RETRY_DAYS = _env_int("REJECT_RETRY_DAYS", 14)
+# Days a job emitted but not processed (per-run cap, not shortlisted, verification failed) is offered again
+PENDING_RETRY_DAYS = _env_int("PENDING_RETRY_DAYS", 7)
+
+# Pipeline: worker threads per stage, bounded queue size between stages, verifier batch size.
+# Small queues keep Hunter lookups from running far ahead of the per-run cap.
+PIPELINE_RESOLVE_WORKERS = max(1, _env_int("PIPELINE_RESOLVE_WORKERS", 3))
+PIPELINE_VERIFY_WORKERS = max(1, _env_int("PIPELINE_VERIFY_WORKERS", 1))
+PIPELINE_QUEUE_SIZE = max(1, _env_int("PIPELINE_QUEUE_SIZE", 5))
+VERIFY_BATCH_SIZE = max(1, _env_int("VERIFY_BATCH_SIZE", 10))
 
 # Optional: extra job sources (skip if not set)
 ADZUNA_APP_ID = os.environ.get("ADZUNA_APP_ID", "").strip()
@@ -1,12 +1,13 @@
 """
 Orchestrate the job application pipeline: fetch jobs, find emails, send applications, report on Telegram.
+The stages themselves run concurrently in src/pipeline.py.
 """
 import logging
 import sys
 from pathlib import Path
 
 import config
-from src import domain_resolver, email_finder, email_sender, email_verifier, job_discovery, state, telegram_notifier
+from src import discovery_state, disk_cache, email_sender, hunter_budget, metrics, pipeline, state, telegram_notifier
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,64 +18,31 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 STATE_PATH = Path(__file__).resolve().parent / "data" / "applied.json"
+DISCOVERY_STATE_PATH = STATE_PATH.with_name("discovery.json")
+HUNTER_BUDGET_PATH = STATE_PATH.with_name("hunter_budget.json")
 
 
-def main() -> None:
+def main() -> dict:
+    """One run; returns the pipeline summary (applications sent, skips, per-stage timings)."""
     config.validate_config()
-    applied = state.load_applied(STATE_PATH)
-    jobs = job_discovery.fetch_all_jobs()
-    sent = 0
+    applied = state.load_index(STATE_PATH)
+    seen = discovery_state.load(DISCOVERY_STATE_PATH)
+    hunter_budget.plan(HUNTER_BUDGET_PATH)
     cap = config.MAX_APPLICATIONS_PER_RUN
-    for job in jobs:
-        if sent >= cap:
-            logger.info("Reached cap of %d applications, stopping", cap)
-            break
-        job_url = (job.get("url") or "").strip()
-        if not job_url:
-            continue
-        if state.is_applied(job_url, applied):
-            logger.debug("Skipped (already applied): %s", job_url[:60])
-            continue
-        company = (job.get("company") or "").strip()
-        if not company:
-            continue
-        domains = domain_resolver.candidate_domains(company)
-        to_email = None
-        for domain in domains:
-            to_email = email_finder.find_email_for_domain(domain)
-            if to_email:
-                break
-        if not to_email:
-            logger.info("No email for domain (company: %s), skip", company[:40])
-            continue
-        if not email_verifier.is_deliverable(to_email):
-            logger.info("Email not deliverable, skip %s (company: %s)", to_email, company[:40])
-            continue
-        ok = email_sender.send_application_email(
-            to_email,
-            company,
-            job.get("position") or job.get("title") or "Spring Boot Developer",
-        )
-        if not ok:
-            continue
-        telegram_notifier.send_telegram_report(
-            job.get("position") or job.get("title") or "Spring Boot Developer",
-            company,
-            job_url,
-            to_email,
-            job.get("source", ""),
-        )
-        state.append_applied(
-            job.get("source", ""),
-            job.get("id", ""),
-            job_url,
-            company,
-            applied,
-            STATE_PATH,
-        )
-        sent += 1
-        logger.info("Applied to %s (%s)", company, job_url[:50])
-    logger.info("Done. Applied to %d jobs (cap %d).", sent, cap)
+    smtp = email_sender.SmtpSession()
+    reporter = telegram_notifier.Reporter()
+    try:
+        summary = pipeline.run(applied, STATE_PATH, smtp, cap, seen, reporter)
+    finally:
+        smtp.close()
+        reporter.close()
+        state.compact(applied, STATE_PATH)
+        seen.save()
+        disk_cache.save_all()
+        hunter_budget.record()
+        metrics.export()
+    logger.info("Done. Applied to %d jobs (cap %d).", summary["applied"], cap)
+    return summary
 
 
 if __name__ == "__main__":
@@ -0,0 +1,40 @@
+"""
+Atomic file writes for the state, cache, budget and metrics files: the content goes to
+<name>.tmp next to the target, is fsynced and renamed over it, so a crash leaves either
+the old file or the new one, never half of one.
+"""
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+
+@contextmanager
+def _replacing(path: Path) -> Iterator[IO[str]]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(path)
+    finally:
+        if tmp.exists():
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+def write_text(path: Path, text: str) -> None:
+    """Replace path with text. Raises OSError (the temporary file is removed)."""
+    with _replacing(path) as f:
+        f.write(text)
+
+
+def write_json(path: Path, data, indent: int | None = None) -> None:
+    """Replace path with data as JSON (UTF-8, not ASCII-escaped). Raises OSError (the temporary file is removed)."""
+    with _replacing(path) as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
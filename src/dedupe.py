@@ -0,0 +1,86 @@
+"""
+Cross-source deduplication: the same posting on Remotive, Jobicy and WWR has three URLs.
+Jobs are bucketed by company slug; inside a bucket two titles are the same posting when
+their normalized word sets are equal or overlap by at least SIMILARITY (Jaccard).
+Buckets hold a handful of jobs, so a pass over the merged list is near-linear.
+"""
+import re
+import threading
+
+from src.domain_resolver import slugify
+from src.models import Job
+
+SIMILARITY = 0.8
+
+# Words that differ between boards for the same posting and say nothing about the role:
+# location, remote and employment-type tags ("(Remote - Europe)", "[Hiring]", "| Full-time").
+# Bracketed groups and " | ..." suffixes are not dropped wholesale, since they often name
+# the role ("Backend Engineer (Java)" vs "(Python)").
+_NOISE = frozenset(
+    "a an and at for in of on or the to with only "
+    "remote remotely hybrid onsite office anywhere worldwide global international "
+    "europe eu emea uk usa us na north america americas latam apac asia "
+    "cet cest est pst utc gmt timezone timezones tz "
+    "job jobs hiring urgent new opening position vacancy "
+    "fulltime full time parttime part contract contractor freelance permanent temporary "
+    "m f w d x h".split()
+)
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def title_tokens(title: str, company: str = "") -> frozenset[str]:
+    """
+    Normalized words of a job title, without location/employment noise words and the
+    company's own name ("Java Developer at Acme" is "Java Developer" at Acme).
+    """
+    if not title or not isinstance(title, str):
+        return frozenset()
+    text = title.lower()
+    drop = _NOISE | set(_TOKEN.findall(company.lower())) if company else _NOISE
+    return frozenset(t for t in _TOKEN.findall(text) if t not in drop)
+
+
+def _similar(a: frozenset[str], b: frozenset[str]) -> bool:
+    if not a or not b:
+        return False
+    return len(a & b) / len(a | b) >= SIMILARITY
+
+
+class PostingIndex:
+    """Jobs kept so far, indexed by (company slug, title words). Safe to share between threads."""
+
+    def __init__(self) -> None:
+        self._exact: dict[tuple[str, frozenset[str]], Job] = {}
+        self._buckets: dict[str, list[tuple[frozenset[str], Job]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, job: Job) -> Job | None:
+        """
+        Index job and return None, or return the already kept job it duplicates (recording
+        the duplicate's source in that job's merged_sources). Jobs without a company or
+        title are always kept.
+        """
+        company = slugify(job.company)
+        tokens = title_tokens(job.position, job.company)
+        if not company or not tokens:
+            return None
+        with self._lock:
+            kept = self._exact.get((company, tokens))
+            if kept is None:
+                for other, candidate in self._buckets.get(company, ()):
+                    if _similar(tokens, other):
+                        kept = candidate
+                        break
+            if kept is None:
+                self._exact[(company, tokens)] = job
+                self._buckets.setdefault(company, []).append((tokens, job))
+                return None
+            if job.source and job.source != kept.source and job.source not in kept.merged_sources:
+                kept.merged_sources += (job.source,)
+            return kept
+
+
+def dedupe_postings(jobs: list[Job]) -> list[Job]:
+    """Keep the first occurrence of each posting across sources (see PostingIndex)."""
+    index = PostingIndex()
+    return [job for job in jobs if index.add(job) is None]
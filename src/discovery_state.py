@@ -0,0 +1,138 @@
+"""
+What discovery has already seen, in data/discovery.json (committed in CI like applied.json):
+- a per-source high-water mark: postings published at or before it were emitted in an
+  earlier run and are not emitted again;
+- jobs emitted but not processed (per-run cap, not shortlisted, same company, verification
+  failed) as pending, emitted again until PENDING_RETRY_DAYS have passed;
+- jobs seen and rejected (no company, no email, not deliverable) with a reason and an expiry,
+  after which they are retried even if the watermark has moved past them.
+"""
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import config
+from src import atomic_file
+from src.models import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "discovery.json"
+# Expired rejections not seen again for this long are forgotten (the posting is gone).
+FORGET_AFTER = timedelta(days=30)
+
+
+def _now() -> str:
+    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class DiscoveryState:
+    """Watermarks, pending and rejected jobs, plus what this run emitted and handled."""
+
+    def __init__(
+        self,
+        path: Path,
+        watermarks: dict[str, str],
+        rejected: dict[str, dict],
+        pending: dict[str, dict] | None = None,
+    ) -> None:
+        self.path = path
+        self.watermarks = watermarks
+        self.rejected = rejected
+        self.pending = pending if pending is not None else {}
+        self._emitted: dict[str, list[tuple[str, str]]] = {}  # source -> [(published, url)]
+        self._handled: set[str] = set()
+        # Sources whose whole fetch result was emitted this run; only their watermarks move.
+        self._complete: set[str] = set()
+        self._lock = threading.Lock()
+
+    def should_emit(self, job: Job) -> bool:
+        """True if the job is newer than its source's watermark, still pending, or a dead end due for a retry."""
+        with self._lock:
+            entry = self.rejected.get(job.url)
+            if entry:
+                return entry.get("until", "") <= _now()
+            entry = self.pending.get(job.url)
+            if entry and entry.get("until", "") > _now():
+                return True
+            mark = self.watermarks.get(job.source)
+        return not (mark and job.published and job.published <= mark)
+
+    def track(self, job: Job) -> None:
+        """Remember an emitted job: it moves the watermark, and goes to pending if it is not handled."""
+        if not job.published:
+            return
+        with self._lock:
+            self._emitted.setdefault(job.source, []).append((job.published, job.url))
+
+    def complete(self, source: str) -> None:
+        """Every job the source returned this run went through should_emit (and track)."""
+        with self._lock:
+            self._complete.add(source)
+
+    def mark_handled(self, job: Job) -> None:
+        """The job needs no more work (applied, or already applied before)."""
+        with self._lock:
+            self._handled.add(job.url)
+            self.rejected.pop(job.url, None)
+            self.pending.pop(job.url, None)
+
+    def reject(self, job: Job, reason: str) -> None:
+        """Skip this job until REJECT_RETRY_DAYS have passed."""
+        url = job.url
+        if not url:
+            return
+        until = (datetime.utcnow() + timedelta(days=config.REJECT_RETRY_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with self._lock:
+            self.rejected[url] = {"reason": reason, "until": until, "source": job.source}
+            self.pending.pop(url, None)
+            self._handled.add(url)
+
+    def _advance_watermarks(self) -> None:
+        # A source whose whole list was emitted moves to the newest job emitted; the ones this
+        # run did not get to (cap, shortlist, same company, verification failed) stay pending.
+        # A source whose list was cut short (discovery closed mid-way, a request failed) keeps
+        # its watermark: postings never emitted were not seen.
+        until = (datetime.utcnow() + timedelta(days=config.PENDING_RETRY_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for source, emitted in self._emitted.items():
+            if source not in self._complete:
+                continue
+            for published, url in emitted:
+                if url not in self._handled:
+                    # setdefault: the first expiry stands, so a job nobody picks does not stay forever.
+                    self.pending.setdefault(url, {"until": until, "source": source, "published": published})
+            self.watermarks[source] = max(self.watermarks.get(source, ""), *(published for published, _ in emitted))
+
+    def save(self) -> None:
+        """Advance watermarks, drop expired pending jobs and long-expired rejections, write discovery.json atomically."""
+        with self._lock:
+            self._advance_watermarks()
+            now = _now()
+            self.pending = {u: e for u, e in self.pending.items() if e.get("until", "") > now}
+            horizon = (datetime.utcnow() - FORGET_AFTER).strftime("%Y-%m-%dT%H:%M:%SZ")
+            self.rejected = {u: e for u, e in self.rejected.items() if e.get("until", "") > horizon}
+            data = {"watermarks": self.watermarks, "pending": self.pending, "rejected": self.rejected}
+            try:
+                atomic_file.write_json(self.path, data, indent=2)
+            except OSError as e:
+                logger.warning("Could not save %s: %s", self.path.name, e)
+
+
+def load(path: Path | None = None) -> DiscoveryState:
+    """Load discovery.json. Missing or invalid file means an empty state."""
+    path = path or DEFAULT_PATH
+    data = {}
+    if path.exists():
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Could not load %s: %s", path.name, e)
+    if not isinstance(data, dict):
+        data = {}
+    watermarks = data.get("watermarks") if isinstance(data.get("watermarks"), dict) else {}
+    rejected = data.get("rejected") if isinstance(data.get("rejected"), dict) else {}
+    pending = data.get("pending") if isinstance(data.get("pending"), dict) else {}
+    return DiscoveryState(path, watermarks, rejected, pending)
@@ -0,0 +1,105 @@
+"""
+Small on-disk JSON caches with per-entry TTL and an LRU size bound (data/cache/*.json).
+Entries are loaded on first use and written back by save_all() at the end of a run.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from src import atomic_file, metrics
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "cache"
+DAY = 86400
+
+# Returned by get() on a miss, so a cached None (negative result) is still a hit.
+MISS = object()
+
+_caches: list["DiskCache"] = []
+
+
+class DiskCache:
+    """Key -> value cache persisted as one JSON file. Expired entries count as misses."""
+
+    def __init__(self, path: Path, max_entries: int = 5000) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def _load(self) -> OrderedDict:
+        if self._entries is None:
+            self._entries = OrderedDict()
+            if self.path.exists():
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self._entries.update((k, v) for k, v in data.items() if isinstance(v, dict))
+                except (json.JSONDecodeError, OSError) as e:
+                    logger.warning("Could not load cache %s: %s", self.path.name, e)
+        return self._entries
+
+    def get_entry(self, key: str) -> dict | None:
+        """Return the raw entry (value, fetched_at, expires_at) if present and fresh."""
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is not None and entry.get("expires_at", 0) <= time.time():
+                del entries[key]
+                self._dirty = True
+                entry = None
+            if entry is None:
+                metrics.inc("cache_misses_total", cache=self.path.stem)
+                return None
+            metrics.inc("cache_hits_total", cache=self.path.stem)
+            entries.move_to_end(key)
+            return entry
+
+    def get(self, key: str):
+        """Return the cached value, or MISS if absent or expired."""
+        entry = self.get_entry(key)
+        return MISS if entry is None else entry.get("value")
+
+    def set(self, key: str, value, ttl: float) -> None:
+        """Store value for ttl seconds, evicting least recently used entries past max_entries."""
+        now = time.time()
+        with self._lock:
+            entries = self._load()
+            entries[key] = {"value": value, "fetched_at": now, "expires_at": now + ttl}
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically if it changed."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            try:
+                atomic_file.write_json(self.path, self._entries)
+                self._dirty = False
+            except OSError as e:
+                logger.warning("Could not save cache %s: %s", self.path.name, e)
+
+
+def save_all() -> None:
+    """Persist every cache created in this process."""
+    for cache in _caches:
+        cache.save()
+
+
+def relocate(directory: Path) -> None:
+    """Point every cache at the same file name under directory, dropping loaded entries (benchmarks)."""
+    for cache in _caches:
+        with cache._lock:
+            cache.path = directory / cache.path.name
+            cache._entries = None
+            cache._dirty = False
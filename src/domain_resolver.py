@@ -1,7 +1,16 @@
 """
 Company name to candidate domain(s). Slugify and try .com, .io, .co.
+Candidates can be filtered to mailable ones (MX, or A as implicit MX) before any Hunter call.
 """
+import asyncio
+import logging
 import re
+import threading
+import time
+
+import config
+
+logger = logging.getLogger(__name__)
 
 
 def slugify(name: str) -> str:
@@ -20,3 +29,137 @@ def candidate_domains(company_name: str) -> list[str]:
     if not slug:
         return []
     return [f"{slug}.com", f"{slug}.io", f"{slug}.co"]
+
+
+class DomainNotFound(Exception):
+    """NXDOMAIN: the name does not exist."""
+
+    def __init__(self, ttl: float) -> None:
+        super().__init__("NXDOMAIN")
+        self.ttl = ttl
+
+
+class DnsPythonResolver:
+    """
+    Async resolver backed by dnspython. nameservers is a list of "host" or "host:port";
+    empty means the system configuration.
+    """
+
+    def __init__(self, nameservers: list[str] | None = None, timeout: float = 3.0) -> None:
+        import dns.asyncresolver
+
+        self._resolver = dns.asyncresolver.Resolver(configure=not nameservers)
+        if nameservers:
+            hosts, ports = [], set()
+            for ns in nameservers:
+                host, _, port = ns.partition(":")
+                hosts.append(host)
+                ports.add(int(port or 53))
+            self._resolver.nameservers = hosts
+            self._resolver.port = ports.pop()
+        self._resolver.lifetime = timeout
+
+    async def query(self, name: str, rdtype: str) -> tuple[list[str], float]:
+        """Return (records as text, ttl). Empty list if the name has no such records."""
+        import dns.resolver
+
+        try:
+            answer = await self._resolver.resolve(name, rdtype)
+        except dns.resolver.NXDOMAIN:
+            raise DomainNotFound(config.DNS_NEGATIVE_TTL)
+        except dns.resolver.NoAnswer:
+            return [], config.DNS_NEGATIVE_TTL
+        return [rr.to_text() for rr in answer], answer.rrset.ttl
+
+
+_resolver = None
+_resolver_ready = False
+_cache: dict[str, tuple[bool, float]] = {}  # domain -> (mailable, expires at, monotonic)
+_lock = threading.Lock()
+
+
+def set_resolver(resolver) -> None:
+    """
+    Use resolver for pre-checks: any object with `async query(name, rdtype) -> (records, ttl)`
+    that raises DomainNotFound on NXDOMAIN. None disables the pre-check.
+    """
+    global _resolver, _resolver_ready
+    with _lock:
+        _resolver = resolver
+        _resolver_ready = True
+        _cache.clear()
+
+
+def get_resolver():
+    """The configured resolver; dnspython by default, None if disabled or not installed."""
+    global _resolver, _resolver_ready
+    with _lock:
+        if not _resolver_ready:
+            _resolver_ready = True
+            if config.DNS_PRECHECK:
+                try:
+                    _resolver = DnsPythonResolver(config.DNS_NAMESERVERS or None)
+                except ImportError:
+                    logger.info("dnspython not installed, DNS pre-check disabled")
+        return _resolver
+
+
+def _cached(domain: str) -> bool | None:
+    with _lock:
+        hit = _cache.get(domain)
+        if hit is None or hit[1] <= time.monotonic():
+            return None
+        return hit[0]
+
+
+def _store(domain: str, mailable: bool, ttl: float) -> None:
+    with _lock:
+        _cache[domain] = (mailable, time.monotonic() + max(ttl, 0))
+
+
+async def _check(resolver, domain: str) -> bool:
+    """True if the domain can receive mail. Lookup errors count as mailable (fail open)."""
+    cached = _cached(domain)
+    if cached is not None:
+        return cached
+    try:
+        mx, ttl = await resolver.query(domain, "MX")
+        if mx:
+            # RFC 7505 null MX ("0 .") means the domain accepts no mail.
+            mailable = not all(r.split()[-1] == "." for r in mx)
+        else:
+            # No MX: RFC 5321 falls back to the A record as an implicit MX.
+            a, ttl = await resolver.query(domain, "A")
+            mailable = bool(a)
+    except DomainNotFound as e:
+        mailable, ttl = False, e.ttl
+    except Exception as e:
+        logger.debug("DNS lookup for %s failed: %s", domain, e)
+        return True
+    _store(domain, mailable, ttl)
+    return mailable
+
+
+async def _filter(resolver, domains: list[str]) -> list[str]:
+    results = await asyncio.gather(*(_check(resolver, d) for d in domains))
+    return [d for d, ok in zip(domains, results) if ok]
+
+
+def mailable_domains(domains: list[str]) -> list[str]:
+    """Keep the domains (in order) that have MX or A records. All kept if the pre-check is disabled."""
+    resolver = get_resolver()
+    if resolver is None or not domains:
+        return list(domains)
+    kept = _filter_sync(resolver, domains)
+    dropped = len(domains) - len(kept)
+    if dropped:
+        logger.debug("DNS pre-check dropped %d of %s", dropped, domains)
+    return kept
+
+
+def _filter_sync(resolver, domains: list[str]) -> list[str]:
+    # Fast path: everything cached, no event loop needed.
+    cached = [_cached(d) for d in domains]
+    if all(c is not None for c in cached):
+        return [d for d, ok in zip(domains, cached) if ok]
+    return asyncio.run(_filter(resolver, domains))
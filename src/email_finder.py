@@ -1,55 +1,90 @@
 """
 Find contact email for a domain: use Hunter.io when API key is set, else guess jobs@domain.
+Uncached searches draw on this run's Hunter credit allowance (src.hunter_budget).
 """
 import logging
-import time
-
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import config
+from src import disk_cache, domain_resolver, http_client, hunter_budget, metrics, rate_limit
 
 logger = logging.getLogger(__name__)
 
 HUNTER_DOMAIN_SEARCH = "https://api.hunter.io/v2/domain-search"
 PREFERRED_PREFIXES = ("hr@", "jobs@", "careers@", "contact@", "info@")
 
+_domain_cache = disk_cache.DiskCache(
+    disk_cache.CACHE_DIR / "hunter_domains.json", config.HUNTER_CACHE_MAX_ENTRIES
+)
+# Shared by every find_email_for_company call; Hunter's rate limit is enforced by rate_limit.
+_lookup_pool = ThreadPoolExecutor(max_workers=config.HUNTER_LOOKUP_WORKERS, thread_name_prefix="hunter")
+
+
+def _pick_email(emails: list) -> str | None:
+    """Prefer role addresses (hr@, jobs@, ...), else the first valid one."""
+    for prefix in PREFERRED_PREFIXES:
+        for e in emails:
+            if isinstance(e, dict):
+                addr = (e.get("value") or e.get("email") or "").lower()
+                if addr and addr.startswith(prefix):
+                    return addr
+    for e in emails:
+        if isinstance(e, dict):
+            addr = (e.get("value") or e.get("email") or "").strip()
+            if addr and "@" in addr:
+                return addr
+    return None
 
-def _hunter_find(domain: str) -> str | None:
-    """Return one email from Hunter.io or None."""
+
+def _hunter_find(domain: str, cancel: threading.Event | None = None) -> str | None:
+    """
+    Return one email from Hunter.io or None. Results (including "no email") are cached
+    per domain in data/cache/hunter_domains.json; a fresh cache entry skips the call and the
+    rate limiter. If cancel is set before the request goes out, or this run's search
+    allowance is used up, returns None without caching.
+    """
     if not config.HUNTER_API_KEY:
         return None
     domain = domain.lower().strip()
     if " " in domain or "/" in domain or "@" in domain:
         return None
+    cached = _domain_cache.get(domain)
+    if cached is not disk_cache.MISS:
+        logger.debug("Hunter cache hit for %s", domain)
+        return cached
+    if not hunter_budget.spend("searches"):
+        return None
+    if not rate_limit.wait("api.hunter.io", cancel):
+        hunter_budget.refund("searches")
+        return None
     try:
-        r = requests.get(
-            HUNTER_DOMAIN_SEARCH,
-            params={"domain": domain, "api_key": config.HUNTER_API_KEY},
-            headers={"User-Agent": "AutoApply/1.0"},
-            timeout=15,
-        )
+        with metrics.timer("hunter_request_seconds", endpoint="domain-search"):
+            r = http_client.get(
+                HUNTER_DOMAIN_SEARCH,
+                params={"domain": domain, "api_key": config.HUNTER_API_KEY},
+            )
         r.raise_for_status()
         data = r.json()
         emails = data.get("data", {}).get("emails")
-        if not emails or not isinstance(emails, list):
-            return None
-        for prefix in PREFERRED_PREFIXES:
-            for e in emails:
-                if isinstance(e, dict):
-                    addr = (e.get("value") or e.get("email") or "").lower()
-                    if addr and addr.startswith(prefix):
-                        return addr
-        for e in emails:
-            if isinstance(e, dict):
-                addr = (e.get("value") or e.get("email") or "").strip()
-                if addr and "@" in addr:
-                    return addr
-        return None
+        email = _pick_email(emails) if isinstance(emails, list) else None
     except Exception as e:
+        # Errors are not cached: the next run should try again.
         logger.warning("Hunter domain-search %s failed: %s", domain, e)
+        metrics.inc("hunter_requests_total", endpoint="domain-search", outcome="error")
+        hunter_budget.refund("searches")
         return None
-    finally:
-        time.sleep(1.5)
+    metrics.inc("hunter_requests_total", endpoint="domain-search", outcome="ok")
+    # Hunter only charges a search that returns addresses.
+    if emails:
+        metrics.inc("hunter_credits_used_total", kind="search")
+    else:
+        hunter_budget.refund("searches")
+    if email:
+        _domain_cache.set(domain, email, config.HUNTER_CACHE_TTL_DAYS * disk_cache.DAY)
+    else:
+        _domain_cache.set(domain, None, config.HUNTER_NEGATIVE_TTL_DAYS * disk_cache.DAY)
+    return email
 
 
 def _guess_email(domain: str) -> str | None:
@@ -76,3 +111,36 @@ def find_email_for_domain(domain: str) -> str | None:
     if email:
         return email
     return _guess_email(domain)
+
+
+def find_email_for_company(company: str) -> str | None:
+    """
+    Return one email for the company. Candidate domains (.com, .io, .co) without MX/A records
+    are dropped first; the rest are looked up on Hunter concurrently. The first hit in that
+    preference order wins and lookups still waiting for the rate limiter are cancelled
+    (their credit is given back). Under a credit budget only as many candidates as the
+    run's search allowance still pays for are looked up, most likely first (at least one,
+    so a cached result is still used).
+    Falls back to jobs@ on the first mailable candidate.
+    """
+    candidates = domain_resolver.candidate_domains(company)
+    domains = domain_resolver.mailable_domains(candidates)
+    if not domains:
+        if candidates:
+            logger.info("No mailable domain among %s", ", ".join(candidates))
+        return None
+    if config.HUNTER_API_KEY:
+        left = hunter_budget.remaining("searches")
+        lookups = domains if left is None else domains[: max(1, left)]
+        cancel = threading.Event()
+        futures = [_lookup_pool.submit(_hunter_find, d, cancel) for d in lookups]
+        try:
+            for fut in futures:
+                email = fut.result()
+                if email:
+                    return email
+        finally:
+            cancel.set()
+            for fut in futures:
+                fut.cancel()
+    return _guess_email(domains[0])
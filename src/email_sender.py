@@ -1,23 +1,23 @@
 """
 Send application email via Gmail SMTP: motivation letter + portfolio link.
+SmtpSession keeps one authenticated connection open for a whole run.
 """
 import logging
 import smtplib
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 import config
+from src import metrics
 
 logger = logging.getLogger(__name__)
 
+# Errors from the NOOP probe of a reused connection after which a fresh one is opened.
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError)
 
-def send_application_email(to_email: str, company_name: str, job_position: str) -> bool:
-    """
-    Send one application email to to_email. Subject and body use company_name and job_position.
-    Returns True on success, False on failure.
-    """
-    if not to_email or not config.GMAIL_USER or not config.GMAIL_APP_PASSWORD:
-        return False
+
+def _build_message(to_email: str, company_name: str, job_position: str) -> MIMEMultipart:
     subject = f"Application: Spring Boot Developer – {company_name}"
     body = config.MOTIVATION_LETTER.strip()
     body += f"\n\nPortfolio: {config.PORTFOLIO_URL}\n\n"
@@ -27,13 +27,127 @@ def send_application_email(to_email: str, company_name: str, job_position: str)
     msg["From"] = config.GMAIL_USER
     msg["To"] = to_email
     msg.attach(MIMEText(body, "plain", "utf-8"))
-    try:
-        with smtplib.SMTP("smtp.gmail.com", 587) as smtp:
-            smtp.starttls()
-            smtp.login(config.GMAIL_USER, config.GMAIL_APP_PASSWORD)
-            smtp.sendmail(config.GMAIL_USER, [to_email], msg.as_string())
-        logger.info("Sent application to %s", to_email)
-        return True
-    except Exception as e:
-        logger.warning("SMTP send to %s failed: %s", to_email, e)
-        return False
+    return msg
+
+
+class SmtpSession:
+    """
+    One SMTP connection (STARTTLS + LOGIN done once) reused for every send. LOGIN is
+    required unless SMTP_AUTH=0; a server that does not offer AUTH is an error.
+    A reused connection is probed with NOOP first and replaced if the server dropped it;
+    a send that fails once the message is under way is never retried, since the server
+    may already have accepted it. Use as a context manager.
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        starttls: bool | None = None,
+        auth: bool | None = None,
+    ) -> None:
+        self.host = host or config.SMTP_HOST
+        self.port = port or config.SMTP_PORT
+        self.starttls = config.SMTP_STARTTLS if starttls is None else starttls
+        self.auth = config.SMTP_AUTH if auth is None else auth
+        self._smtp: smtplib.SMTP | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SmtpSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @metrics.timed("smtp_connect_seconds")
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=config.SMTP_TIMEOUT)
+        try:
+            smtp.ehlo()
+            if self.starttls:
+                smtp.starttls()
+                smtp.ehlo()
+            # Only an explicit SMTP_AUTH=0 (a local stand-in) sends without logging in.
+            if self.auth:
+                if not smtp.has_extn("auth"):
+                    raise smtplib.SMTPNotSupportedError(
+                        f"SMTP server {self.host}:{self.port} does not offer AUTH; not sending unauthenticated"
+                        " (set SMTP_AUTH=0 only for a server that needs no login)"
+                    )
+                smtp.login(config.GMAIL_USER, config.GMAIL_APP_PASSWORD)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    def _live(self) -> smtplib.SMTP:
+        """The open connection if it still answers NOOP, else a new one."""
+        if self._smtp is not None:
+            try:
+                code, _ = self._smtp.noop()
+                if code == 250:
+                    return self._smtp
+                logger.info("SMTP connection stale (NOOP %s), reconnecting", code)
+            except RECONNECT_ERRORS as e:
+                logger.info("SMTP connection lost (%s), reconnecting", e)
+            self._drop()
+        self._smtp = self._connect()
+        return self._smtp
+
+    def _drop(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+            self._smtp = None
+
+    @metrics.timed("smtp_send_seconds")
+    def send(self, to_email: str, company_name: str, job_position: str) -> bool:
+        """
+        Send one application email to to_email. Subject and body use company_name and job_position.
+        Returns True on success, False on failure.
+        """
+        if not to_email or not config.GMAIL_USER or not config.GMAIL_APP_PASSWORD:
+            return False
+        raw = _build_message(to_email, company_name, job_position).as_string()
+        with self._lock:
+            try:
+                smtp = self._live()
+            except Exception as e:
+                logger.warning("SMTP connect for %s failed: %s", to_email, e)
+                self._drop()
+                return False
+            try:
+                smtp.sendmail(config.GMAIL_USER, [to_email], raw)
+            except Exception as e:
+                # Not retried: a disconnect after DATA may come after the server took the message.
+                logger.warning("SMTP send to %s failed: %s", to_email, e)
+                if not isinstance(e, smtplib.SMTPRecipientsRefused):
+                    self._drop()
+                return False
+            logger.info("Sent application to %s", to_email)
+            return True
+
+    def send_many(self, applications: list[tuple[str, str, str]]) -> list[bool]:
+        """Send (to_email, company_name, job_position) tuples over this connection, in order."""
+        return [self.send(*application) for application in applications]
+
+    def close(self) -> None:
+        """QUIT and close the connection if open."""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    pass
+                self._drop()
+
+
+def send_application_email(to_email: str, company_name: str, job_position: str) -> bool:
+    """
+    Send one application email to to_email on a one-off connection.
+    Returns True on success, False on failure.
+    """
+    with SmtpSession() as session:
+        return session.send(to_email, company_name, job_position)
@@ -1,54 +1,112 @@
 """
 Verify email deliverability via Hunter.io Email Verifier. When HUNTER_API_KEY is set,
 only addresses with status 'valid' or 'accept_all' are considered deliverable.
+Statuses are cached per address (data/cache/hunter_verifier.json); verify_many checks a whole batch.
+Once this run's verification allowance (src.hunter_budget) is used up, the rest are
+reported unknown like a failed request: skipped this run, not rejected. So is Hunter's own
+'unknown' status, which is re-checked once its short cache entry expires.
 """
 import logging
-import time
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
 
 import config
+from src import disk_cache, http_client, hunter_budget, metrics, rate_limit
 
 logger = logging.getLogger(__name__)
 
 HUNTER_EMAIL_VERIFIER = "https://api.hunter.io/v2/email-verifier"
-REQUEST_HEADERS = {"User-Agent": "AutoApply/1.0 (job application agent)"}
 
 # Treat both 'valid' and 'accept_all' as deliverable (many corporate domains use accept-all).
 DELIVERABLE_STATUSES = ("valid", "accept_all")
+# Hunter may return 'unknown' when the mail server did not answer; re-check those soon.
+SHORT_LIVED_STATUSES = ("unknown",)
+# Not checked: no verification credit left this run (never cached).
+UNVERIFIED = "unverified"
+VERIFY_WORKERS = 4
 
+_verify_cache = disk_cache.DiskCache(
+    disk_cache.CACHE_DIR / "hunter_verifier.json", config.HUNTER_CACHE_MAX_ENTRIES
+)
 
-def is_deliverable(email: str) -> bool:
-    """
-    Return True if the email is considered deliverable.
-    When HUNTER_API_KEY is not set, returns True (no verification, pipeline unchanged).
-    When set, calls Hunter Email Verifier and returns True only for status 'valid' or 'accept_all'.
-    """
+
+def _normalize(email: str) -> str | None:
     if not email or not isinstance(email, str):
-        return False
+        return None
     email = email.strip().lower()
-    if "@" not in email:
-        return False
+    return email if "@" in email else None
 
-    if not config.HUNTER_API_KEY:
-        return True
 
+def _status_ttl(status: str) -> float:
+    days = config.VERIFY_UNKNOWN_TTL_DAYS if status in SHORT_LIVED_STATUSES else config.VERIFY_CACHE_TTL_DAYS
+    return days * disk_cache.DAY
+
+
+def _hunter_status(email: str) -> str | None:
+    """
+    Verifier status for email, from cache or Hunter (rate limited). None on request failure,
+    UNVERIFIED when the run's verification allowance is used up.
+    """
+    cached = _verify_cache.get(email)
+    if cached is not disk_cache.MISS:
+        logger.debug("Hunter verifier cache hit for %s", email)
+        return cached
+    if not hunter_budget.spend("verifications"):
+        return UNVERIFIED
     try:
-        r = requests.get(
-            HUNTER_EMAIL_VERIFIER,
-            params={"email": email, "api_key": config.HUNTER_API_KEY},
-            headers=REQUEST_HEADERS,
-            timeout=15,
-        )
+        rate_limit.wait("api.hunter.io")
+        with metrics.timer("hunter_request_seconds", endpoint="email-verifier"):
+            r = http_client.get(
+                HUNTER_EMAIL_VERIFIER,
+                params={"email": email, "api_key": config.HUNTER_API_KEY},
+            )
         r.raise_for_status()
         data = r.json()
-        status = (data.get("data") or {}).get("status")
-        if status in DELIVERABLE_STATUSES:
-            return True
-        logger.debug("Hunter verifier: %s status=%s", email, status)
-        return False
+        status = (data.get("data") or {}).get("status") or "unknown"
     except Exception as e:
         logger.warning("Hunter email-verifier %s failed: %s", email, e)
+        metrics.inc("hunter_requests_total", endpoint="email-verifier", outcome="error")
+        hunter_budget.refund("verifications")
+        return None
+    metrics.inc("hunter_requests_total", endpoint="email-verifier", outcome="ok")
+    metrics.inc("hunter_credits_used_total", kind="verification")
+    _verify_cache.set(email, status, _status_ttl(status))
+    return status
+
+
+def verify_many(emails: list[str]) -> dict[str, bool | None]:
+    """
+    Verify a batch of addresses: normalized, deduped, cached results reused, and the
+    rest checked concurrently under the shared Hunter rate limiter.
+    Returns {normalized email: deliverable}, None where the Hunter request failed, Hunter
+    answered 'unknown' or no verification credit is left this run (not a dead end). Without HUNTER_API_KEY
+    every valid address is deliverable.
+    """
+    unique = list(dict.fromkeys(e for e in map(_normalize, emails) if e))
+    if not config.HUNTER_API_KEY:
+        return {e: True for e in unique}
+    if len(unique) <= 1:
+        statuses = [_hunter_status(e) for e in unique]
+    else:
+        with ThreadPoolExecutor(max_workers=min(VERIFY_WORKERS, len(unique))) as pool:
+            statuses = list(pool.map(_hunter_status, unique))
+    result = {}
+    for email, status in zip(unique, statuses):
+        if status is None or status == UNVERIFIED or status in SHORT_LIVED_STATUSES:
+            result[email] = None
+            continue
+        result[email] = status in DELIVERABLE_STATUSES
+        if not result[email]:
+            logger.debug("Hunter verifier: %s status=%s", email, status)
+    return result
+
+
+def is_deliverable(email: str) -> bool:
+    """
+    Return True if the email is considered deliverable.
+    When HUNTER_API_KEY is not set, returns True (no verification, pipeline unchanged).
+    When set, uses the cached or fresh Hunter status: True only for 'valid' or 'accept_all'.
+    """
+    email = _normalize(email)
+    if not email:
         return False
-    finally:
-        time.sleep(1.5)
+    return bool(verify_many([email])[email])
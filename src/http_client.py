@@ -0,0 +1,84 @@
+"""
+Shared HTTP session for every outbound API call: keep-alive pools per host,
+retry with backoff on 429/5xx (honouring Retry-After) and one timeout policy.
+"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import config
+
+USER_AGENT = "AutoApply/1.0 (job application agent)"
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+BACKOFF_FACTOR = 0.5
+
+# Keep-alive connections kept per host. Hosts not listed share the default adapter.
+POOL_SIZES = {
+    "api.hunter.io": 4,
+    "api.telegram.org": 2,
+    "www.themuse.com": 2,
+    "api.adzuna.com": 2,
+    "weworkremotely.com": 2,
+    "www.realworkfromanywhere.com": 3,
+}
+DEFAULT_POOL_SIZE = 2
+
+_session: requests.Session | None = None
+_lock = threading.Lock()
+
+
+def _retry() -> Retry:
+    # Only idempotent methods are retried; a POST that reached the server is not replayed.
+    return Retry(
+        total=config.HTTP_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _build_session() -> requests.Session:
+    s = requests.Session()
+    s.headers["User-Agent"] = USER_AGENT
+    default = HTTPAdapter(pool_connections=8, pool_maxsize=DEFAULT_POOL_SIZE, max_retries=_retry())
+    s.mount("https://", default)
+    s.mount("http://", default)
+    for host, size in POOL_SIZES.items():
+        s.mount(f"https://{host}/", HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=_retry()))
+    return s
+
+
+def session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request through the shared session with the default (connect, read) timeout."""
+    kwargs.setdefault("timeout", (config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT))
+    return session().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def close() -> None:
+    """Close pooled connections (end of run)."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
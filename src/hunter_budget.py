@@ -0,0 +1,195 @@
+"""
+Hunter credit budget. Domain searches and verifications come out of a monthly quota;
+spent first come, first served it runs out mid-month and every later lookup falls back
+to a guessed jobs@ address.
+
+plan() reads what is left (Hunter's account endpoint, else HUNTER_MONTHLY_* minus the
+spend recorded in data/hunter_budget.json) and gives this run its share: what was left at
+the start of the day spread over the days until the quota resets, less what earlier runs
+spent today. email_finder and email_verifier take a credit before each uncached call and
+give it back when Hunter does not charge. With ranking on, the pipeline feeds its final
+shortlist best first, so the credits go to the best jobs overall and, per company, to the
+most likely domain. record() adds the run's spend to the ledger so later runs plan around it.
+"""
+import json
+import logging
+import math
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
+import config
+from src import atomic_file, http_client, metrics, rate_limit
+
+logger = logging.getLogger(__name__)
+
+HUNTER_ACCOUNT = "https://api.hunter.io/v2/account"
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "hunter_budget.json"
+KINDS = ("searches", "verifications")
+# Runs kept in the ledger's history.
+MAX_RUNS = 90
+
+
+class Budget:
+    """Credits this run may spend per kind; allowance None means unlimited."""
+
+    def __init__(self, allowance: dict[str, int] | None = None, reset_date: str = "") -> None:
+        self.allowance = allowance
+        self.reset_date = reset_date
+        self.spent = {kind: 0 for kind in KINDS}
+        self._exhausted: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def limited(self) -> bool:
+        return self.allowance is not None
+
+    def spend(self, kind: str) -> bool:
+        """Take one credit of kind; False (logged once per kind) when the allowance is used up."""
+        with self._lock:
+            if self.allowance is not None and self.spent[kind] >= self.allowance.get(kind, 0):
+                first = kind not in self._exhausted
+                self._exhausted.add(kind)
+            else:
+                self.spent[kind] += 1
+                return True
+        metrics.inc("hunter_budget_exhausted_total", kind=kind)
+        if first:
+            logger.info("Hunter %s allowance for this run used up (%d)", kind, self.allowance.get(kind, 0))
+        return False
+
+    def remaining(self, kind: str) -> int | None:
+        """Credits of kind still unspent this run; None when unlimited."""
+        with self._lock:
+            if self.allowance is None:
+                return None
+            return max(0, self.allowance.get(kind, 0) - self.spent[kind])
+
+    def refund(self, kind: str) -> None:
+        """Give back a credit Hunter did not charge (request failed, or a search found nothing)."""
+        with self._lock:
+            self.spent[kind] = max(0, self.spent[kind] - 1)
+
+
+_budget = Budget()
+_path = DEFAULT_PATH
+_ledger: dict = {}
+
+
+def spend(kind: str) -> bool:
+    return _budget.spend(kind)
+
+
+def refund(kind: str) -> None:
+    _budget.refund(kind)
+
+
+def remaining(kind: str) -> int | None:
+    return _budget.remaining(kind)
+
+
+def _next_month(today: date) -> date:
+    return date(today.year + today.month // 12, today.month % 12 + 1, 1)
+
+
+def _account() -> tuple[dict[str, int], str] | None:
+    """Credits left per kind and the reset date, from Hunter's account endpoint (free). None on failure."""
+    try:
+        rate_limit.wait("api.hunter.io")
+        r = http_client.get(HUNTER_ACCOUNT, params={"api_key": config.HUNTER_API_KEY})
+        r.raise_for_status()
+        data = r.json().get("data") or {}
+        requests = data.get("requests") or {}
+        left = {}
+        for kind in KINDS:
+            counts = requests.get(kind) or {}
+            left[kind] = max(0, int(counts.get("available", 0)) - int(counts.get("used", 0)))
+        return left, str(data.get("reset_date") or "")
+    except Exception as e:
+        logger.warning("Hunter account lookup failed, using the local ledger: %s", e)
+        return None
+
+
+def _load(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            ledger = json.load(f)
+        return ledger if isinstance(ledger, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Could not read %s: %s", path, e)
+        return {}
+
+
+def _spent_on(ledger: dict, day: str) -> dict[str, int]:
+    spent = {kind: 0 for kind in KINDS}
+    for run in ledger.get("runs") or []:
+        if str(run.get("at", "")).startswith(day):
+            for kind in KINDS:
+                spent[kind] += int((run.get("spent") or {}).get(kind, 0))
+    return spent
+
+
+def plan(path: Path | None = None, today: date | None = None) -> Budget:
+    """Set this run's allowance. Unlimited without HUNTER_API_KEY or with HUNTER_BUDGET=0."""
+    global _budget, _path, _ledger
+    _path = path or DEFAULT_PATH
+    _ledger = _load(_path)
+    if not config.HUNTER_API_KEY or not config.HUNTER_BUDGET:
+        _budget = Budget()
+        return _budget
+    today = today or datetime.utcnow().date()
+    spent_today = _spent_on(_ledger, today.isoformat())
+    account = _account()
+    if account is not None:
+        left, reset_date = account
+        # The account's count already includes what earlier runs spent today.
+        start_of_day = {kind: left[kind] + spent_today[kind] for kind in KINDS}
+    else:
+        reset_date = str(_ledger.get("reset_date") or "")
+        used = (_ledger.get("used") or {}) if reset_date > today.isoformat() else {}
+        monthly = {"searches": config.HUNTER_MONTHLY_SEARCHES, "verifications": config.HUNTER_MONTHLY_VERIFICATIONS}
+        start_of_day = {kind: max(0, monthly[kind] - int(used.get(kind, 0)) + spent_today[kind]) for kind in KINDS}
+        left = {kind: max(0, start_of_day[kind] - spent_today[kind]) for kind in KINDS}
+    if reset_date <= today.isoformat():
+        reset_date = _next_month(today).isoformat()
+    days_left = max(1, (date.fromisoformat(reset_date[:10]) - today).days)
+    allowance = {
+        kind: min(left[kind], max(0, math.ceil(start_of_day[kind] / days_left) - spent_today[kind])) for kind in KINDS
+    }
+    _budget = Budget(allowance, reset_date)
+    logger.info(
+        "Hunter budget: %d searches, %d verifications this run (%d / %d left, resets %s)",
+        allowance["searches"],
+        allowance["verifications"],
+        left["searches"],
+        left["verifications"],
+        reset_date[:10],
+    )
+    for kind in KINDS:
+        metrics.set_gauge("hunter_budget_allowance", allowance[kind], kind=kind)
+        metrics.set_gauge("hunter_credits_left", left[kind], kind=kind)
+    return _budget
+
+
+def record() -> None:
+    """Add this run's spend to the ledger (atomic write). Logs, never raises."""
+    budget = _budget
+    if not budget.limited:
+        return
+    ledger = dict(_ledger)
+    if ledger.get("reset_date") != budget.reset_date:
+        ledger["used"] = {}
+    used = ledger.get("used") or {}
+    ledger["used"] = {kind: int(used.get(kind, 0)) + budget.spent[kind] for kind in KINDS}
+    ledger["reset_date"] = budget.reset_date
+    run = {"at": datetime.utcnow().isoformat() + "Z", "allowance": budget.allowance, "spent": dict(budget.spent)}
+    ledger["runs"] = ((ledger.get("runs") or []) + [run])[-MAX_RUNS:]
+    try:
+        atomic_file.write_json(_path, ledger, indent=2)
+        logger.info(
+            "Hunter spend this run: %d searches, %d verifications", budget.spent["searches"], budget.spent["verifications"]
+        )
+    except OSError as e:
+        logger.warning("Could not write %s: %s", _path, e)
@@ -1,422 +1,338 @@
 """
-Fetch jobs from all 10 sources (APIs + RSS), normalize, filter by Spring Boot/Java/backend, dedupe by URL.
+Fetch jobs from the enabled sources (APIs + RSS), normalize, filter by Spring Boot/Java/backend, dedupe by URL.
+Sources are declarative specs (src.sources); fetch_source is the one engine that runs them.
 """
+import json
 import logging
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator
+from urllib.parse import urlencode
+
 import feedparser
 import requests
 
 import config
+from src import dedupe, discovery_state, disk_cache, http_client, json_stream, metrics, rate_limit, sources
+from src.keyword_matcher import KeywordMatcher
+from src.models import Job
+from src.sources import SourceSpec
 
 logger = logging.getLogger(__name__)
 
-KEYWORDS = ("spring boot", "springboot", "java", "backend")
-REQUEST_HEADERS = {"User-Agent": "AutoApply/1.0 (job application agent)"}
+KEYWORDS = config.JOB_KEYWORDS
+MATCHER = KeywordMatcher(KEYWORDS, config.JOB_NEGATIVE_KEYWORDS, config.JOB_FIELD_WEIGHTS)
 
+# ETag / Last-Modified plus parsed jobs for the full-dump sources and RSS feeds.
+_http_cache = disk_cache.DiskCache(disk_cache.CACHE_DIR / "sources_http.json", max_entries=100)
 
-def _matches(job: dict) -> bool:
-    """True if job title/position/tags/description contain any keyword."""
-    text = " ".join(
-        str(job.get(k, "")) for k in ("position", "title", "company", "company_name")
-    ).lower()
-    desc = (job.get("description") or job.get("summary") or "").lower()
-    tags = " ".join(job.get("tags") or []).lower()
-    combined = f"{text} {desc} {tags}"
-    return any(kw in combined for kw in KEYWORDS)
 
+# Cancel event of the iter_jobs() call the current worker thread is fetching for.
+_local = threading.local()
 
-def _normalize(source: str, job_id: str, company: str, position: str, url: str) -> dict | None:
-    if not (company or position) or not url:
-        return None
-    return {
-        "source": source,
-        "id": str(job_id),
-        "company": (company or "").strip(),
-        "position": (position or "").strip(),
-        "url": url.strip(),
-    }
 
+def _cancelled() -> bool:
+    cancel = getattr(_local, "cancel", None)
+    return cancel is not None and cancel.is_set()
 
-def fetch_remoteok() -> list[dict]:
-    """RemoteOK API. First element is metadata."""
-    try:
-        r = requests.get(
-            "https://remoteok.com/api",
-            headers=REQUEST_HEADERS,
-            timeout=30,
-        )
-        r.raise_for_status()
-        data = r.json()
-        if not isinstance(data, list) or len(data) < 2:
-            return []
-        jobs = []
-        for item in data[1:]:
-            if not isinstance(item, dict):
-                continue
-            job_url = (item.get("url") or item.get("apply_url") or "").strip()
-            if not job_url:
-                continue
-            norm = _normalize(
-                "remoteok",
-                item.get("id", ""),
-                item.get("company", ""),
-                item.get("position", ""),
-                job_url,
-            )
-            if norm and _matches({**item, "title": item.get("position"), "tags": item.get("tags") or []}):
-                jobs.append(norm)
-        return jobs
-    except Exception as e:
-        logger.warning("RemoteOK fetch failed: %s", e)
-        return []
-
-
-def fetch_remotive() -> list[dict]:
-    """Remotive API. Rate: max 2 req/min."""
-    time.sleep(35)  # stay under 2/min
-    try:
-        r = requests.get(
-            "https://remotive.com/api/remote-jobs",
-            params={"category": "software-dev", "search": "spring boot", "limit": 100},
-            headers=REQUEST_HEADERS,
-            timeout=30,
-        )
-        r.raise_for_status()
-        data = r.json()
-        jobs_list = data.get("jobs") if isinstance(data, dict) else []
-        jobs = []
-        for item in jobs_list or []:
-            if not isinstance(item, dict):
-                continue
-            url = (item.get("url") or "").strip()
-            if not url:
-                continue
-            norm = _normalize(
-                "remotive",
-                item.get("id", ""),
-                item.get("company_name", ""),
-                item.get("title", ""),
-                url,
-            )
-            if norm and _matches({**item, "position": item.get("title"), "company": item.get("company_name")}):
-                jobs.append(norm)
-        return jobs
-    except Exception as e:
-        logger.warning("Remotive fetch failed: %s", e)
-        return []
-
-
-def fetch_jobicy() -> list[dict]:
-    """Jobicy API."""
-    time.sleep(35)
-    try:
-        r = requests.get(
-            "https://jobicy.com/api/v2/remote-jobs",
-            params={"tag": "spring boot", "count": 100},
-            headers=REQUEST_HEADERS,
-            timeout=30,
-        )
-        r.raise_for_status()
-        data = r.json()
-        jobs_list = data.get("jobs") if isinstance(data, dict) else []
-        jobs = []
-        for item in jobs_list or []:
-            if not isinstance(item, dict):
-                continue
-            url = (item.get("url") or "").strip()
-            if not url:
-                continue
-            norm = _normalize(
-                "jobicy",
-                item.get("id", ""),
-                item.get("companyName", ""),
-                item.get("jobTitle", ""),
-                url,
-            )
-            if norm and _matches({**item, "position": item.get("jobTitle"), "company": item.get("companyName")}):
-                jobs.append(norm)
-        return jobs
-    except Exception as e:
-        logger.warning("Jobicy fetch failed: %s", e)
-        return []
-
-
-def fetch_working_nomads() -> list[dict]:
-    """Working Nomads API. Full list, filter in code."""
+
+def _throttle(host: str) -> bool:
+    """Wait for the host's rate limiter. False if the fetch was cancelled meanwhile."""
+    return rate_limit.wait(host, getattr(_local, "cancel", None))
+
+
+def _matches(job: Job, tags: str | Iterable[str] | None = None, description: str | None = None) -> bool:
+    """
+    True if the job's position/company plus the raw posting's tags/description match the
+    keyword set (see MATCHER). Most postings fail, so the threshold check stops early; only
+    jobs that pass get their full weighted score, kept in job.match_score for ranking.
+    """
+    fields = {
+        "title": job.position,
+        "tags": tags if isinstance(tags, (str, list, tuple)) else (),
+        "company": job.company,
+        "description": description if isinstance(description, str) else "",
+    }
+    if not MATCHER.matches(fields):
+        return False
+    job.match_score = MATCHER.score(fields)
+    return True
+
+
+def _iso_date(value) -> str:
+    """
+    Posting date as "YYYY-MM-DDTHH:MM:SSZ" (UTC) so dates compare as strings.
+    Accepts ISO strings, "YYYY-MM-DD HH:MM:SS", epoch seconds and feedparser's struct_time.
+    Returns "" if missing or unparseable.
+    """
+    if not value:
+        return ""
     try:
-        r = requests.get(
-            "https://www.workingnomads.com/api/exposed_jobs/",
-            headers=REQUEST_HEADERS,
-            timeout=30,
-        )
+        if isinstance(value, time.struct_time):
+            dt = datetime(*value[:6], tzinfo=timezone.utc)
+        elif isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+            dt = datetime.fromtimestamp(int(value), tz=timezone.utc)
+        else:
+            dt = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00").replace(" ", "T", 1))
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    except (ValueError, TypeError, OverflowError):
+        return ""
+
+
+def _normalize(
+    source: str, job_id: str, company: str, position: str, url: str, published="",
+) -> Job | None:
+    if not (company or position) or not url:
+        return None
+    return Job(
+        source,
+        str(job_id),
+        company.strip() if isinstance(company, str) else "",
+        position.strip() if isinstance(position, str) else "",
+        url.strip(),
+        _iso_date(published),
+    )
+
+
+def _conditional_get(
+    url: str,
+    parse: Callable[[requests.Response], list[Job]],
+    params: dict | None = None,
+    secret_params: Iterable[str] = (),
+) -> list[Job]:
+    """
+    GET url (with params) with If-None-Match / If-Modified-Since from the last response. On 304
+    the jobs parsed last time are returned from data/cache/sources_http.json without downloading
+    or parsing. The body is streamed: parse may read it incrementally (r.iter_content) instead of
+    r.content. Params named in secret_params (API keys) are left out of the cache key.
+    """
+    params = params or {}
+    secret = set(secret_params)
+    query = urlencode(sorted((k, str(v)) for k, v in params.items() if k not in secret))
+    # Keyword or weight changes invalidate cached parse results (and their match scores).
+    weights = ",".join(f"{k}:{v}" for k, v in sorted(MATCHER.weights.items()))
+    key = f"{url}{'?' + query if query else ''}|{','.join(MATCHER.keywords)}|{','.join(config.JOB_NEGATIVE_KEYWORDS)}|{weights}"
+    entry = _http_cache.get(key)
+    headers = {}
+    if entry is not disk_cache.MISS:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    with http_client.get(url, params=params, headers=headers, stream=True) as r:
+        if r.status_code == 304 and entry is not disk_cache.MISS:
+            logger.debug("Not modified, reusing %d cached jobs: %s", len(entry["jobs"]), url)
+            return [Job.from_dict(job) for job in entry["jobs"]]
         r.raise_for_status()
-        data = r.json()
-        if not isinstance(data, list):
-            return []
-        jobs = []
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            url = (item.get("url") or "").strip()
-            if not url:
-                continue
-            norm = _normalize(
-                "workingnomads",
-                url,
-                item.get("company_name", ""),
-                item.get("title", ""),
-                url,
-            )
-            desc = (item.get("description") or "").lower()
-            if norm and _matches({**item, "position": item.get("title"), "description": desc}):
-                jobs.append(norm)
-        return jobs
-    except Exception as e:
-        logger.warning("Working Nomads fetch failed: %s", e)
-        return []
-
-
-def fetch_jobscollider() -> list[dict]:
-    """JobsCollider API."""
-    time.sleep(5)
-    try:
-        r = requests.get(
-            "https://jobscollider.com/api/search-jobs",
-            params={"query": "spring boot", "category": "software_development"},
-            headers=REQUEST_HEADERS,
-            timeout=30,
+        jobs = parse(r)
+    if _cancelled():
+        return jobs  # cut short: not the whole response, so not cached
+    etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    if etag or last_modified:
+        _http_cache.set(
+            key,
+            {"etag": etag, "last_modified": last_modified, "jobs": [job.to_dict() for job in jobs]},
+            config.SOURCE_CACHE_TTL_DAYS * disk_cache.DAY,
         )
-        r.raise_for_status()
-        data = r.json()
-        jobs_list = data.get("jobs") if isinstance(data, dict) else []
-        jobs = []
-        for item in jobs_list or []:
-            if not isinstance(item, dict):
-                continue
-            url = (item.get("url") or "").strip()
-            if not url:
-                continue
-            norm = _normalize(
-                "jobscollider",
-                item.get("id", ""),
-                item.get("company_name", ""),
-                item.get("title", ""),
-                url,
-            )
-            if norm and _matches({**item, "position": item.get("title"), "company": item.get("company_name")}):
-                jobs.append(norm)
-        return jobs
-    except Exception as e:
-        logger.warning("JobsCollider fetch failed: %s", e)
-        return []
-
-
-def _parse_wwr_entry(entry, source: str) -> dict | None:
-    """Parse one We Work Remotely RSS entry."""
-    link = (entry.get("link") or "").strip()
-    title = (entry.get("title") or "").strip()
-    if not link:
-        return None
-    # Title often like "Company Name: Job Title" or just "Job Title"
-    company = ""
-    if ":" in title:
-        company, _, position = title.partition(":")
-        position = position.strip()
-    else:
-        position = title
-    norm = _normalize(source, link, company, position, link)
-    if norm and _matches({"position": position, "title": position, "company": company}):
-        return norm
-    return None
-
-
-def fetch_wwr() -> list[dict]:
-    """We Work Remotely RSS feeds."""
-    base = "https://weworkremotely.com/categories/"
-    urls = [
-        base + "remote-programming-jobs.rss",
-        base + "remote-back-end-programming-jobs.rss",
-    ]
-    jobs = []
-    for url in urls:
-        try:
-            feed = feedparser.parse(url, request_headers=REQUEST_HEADERS)
-            for entry in feed.get("entries") or []:
-                norm = _parse_wwr_entry(entry, "wwr")
-                if norm:
-                    jobs.append(norm)
-        except Exception as e:
-            logger.warning("WWR RSS %s failed: %s", url, e)
     return jobs
 
 
-def fetch_adzuna() -> list[dict]:
-    """Adzuna API. Only if keys set."""
-    if not (config.ADZUNA_APP_ID and config.ADZUNA_APP_KEY):
-        return []
-    jobs = []
-    for country in ("gb", "us"):
-        try:
-            r = requests.get(
-                f"https://api.adzuna.com/v1/api/jobs/{country}/search/1",
-                params={
-                    "app_id": config.ADZUNA_APP_ID,
-                    "app_key": config.ADZUNA_APP_KEY,
-                    "what": "spring boot java backend",
-                },
-                headers=REQUEST_HEADERS,
-                timeout=30,
-            )
-            r.raise_for_status()
-            data = r.json()
-            results = data.get("results") if isinstance(data, dict) else []
-            for item in results or []:
-                if not isinstance(item, dict):
-                    continue
-                url = (item.get("redirect_url") or item.get("url") or "").strip()
-                if not url:
-                    continue
-                norm = _normalize(
-                    "adzuna",
-                    item.get("id", ""),
-                    item.get("company", {}).get("display_name", "") if isinstance(item.get("company"), dict) else "",
-                    item.get("title", ""),
-                    url,
-                )
-                if norm and _matches({**item, "position": item.get("title")}):
-                    jobs.append(norm)
-            time.sleep(2)
-        except Exception as e:
-            logger.warning("Adzuna %s fetch failed: %s", country, e)
-    return jobs
+def _lookup(data, path: str | None):
+    """Value at a dotted path ("company.name"); with "a|b" the first non-empty alternative. None if missing."""
+    if not path:
+        return None
+    for alternative in path.split("|"):
+        value = data
+        for key in alternative.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None and value != "":
+            return value
+    return None
 
 
-def fetch_themuse() -> list[dict]:
-    """The Muse API. Only if key set."""
-    if not config.THEMUSE_API_KEY:
-        return []
+def _to_job(spec: SourceSpec, item: dict) -> Job | None:
+    fields = spec.fields
+    url = _lookup(item, fields.get("url"))
+    if not isinstance(url, str) or not url.strip():
+        return None
+    company = _lookup(item, fields.get("company")) or ""
+    position = _lookup(item, fields.get("position")) or ""
+    if spec.company_in_title and isinstance(position, str) and spec.company_in_title in position:
+        company, _, position = position.partition(spec.company_in_title)
+    return _normalize(
+        spec.name,
+        _lookup(item, fields.get("id")) or "",
+        company,
+        position,
+        url,
+        _lookup(item, fields.get("published")),
+    )
+
+
+def _read(r) -> bytes | None:
+    """The response body, read in chunks; None (and the source marked partial) if cancelled meanwhile."""
+    chunks = []
+    for chunk in r.iter_content(json_stream.CHUNK_SIZE):
+        if _cancelled():
+            _local.partial = True
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _parse(spec: SourceSpec, r) -> list[Job]:
+    """
+    Read the postings out of one response per spec.format and keep only matching jobs.
+    Stops reading when the fetch is cancelled (see _cancelled) and keeps what it has so far.
+    """
+    if spec.format == "json_stream":
+        items = json_stream.iter_array(r.iter_content(json_stream.CHUNK_SIZE))
+    else:
+        body = _read(r)
+        if body is None:
+            return []
+        if spec.format == "rss":
+            items = feedparser.parse(body).get("entries") or []
+        else:
+            data = json.loads(body)
+            items = _lookup(data, spec.items) if spec.items else data
+            if not isinstance(items, list):
+                items = []
     jobs = []
-    try:
-        for page in range(1, 4):
-            r = requests.get(
-                "https://www.themuse.com/api/public/jobs",
-                params={"page": page, "api_key": config.THEMUSE_API_KEY},
-                headers=REQUEST_HEADERS,
-                timeout=30,
-            )
-            r.raise_for_status()
-            data = r.json()
-            results = data.get("results") if isinstance(data, dict) else []
-            for item in results or []:
-                if not isinstance(item, dict):
-                    continue
-                url = (item.get("refs", {}).get("landing_page") or item.get("url") or "").strip()
-                if not url:
-                    continue
-                norm = _normalize(
-                    "themuse",
-                    item.get("id", ""),
-                    item.get("company", {}).get("name", "") if isinstance(item.get("company"), dict) else "",
-                    item.get("name", ""),
-                    url,
-                )
-                if norm and _matches({**item, "position": item.get("name"), "title": item.get("name")}):
-                    jobs.append(norm)
-            time.sleep(1)
-    except Exception as e:
-        logger.warning("The Muse fetch failed: %s", e)
+    for i, item in enumerate(items):
+        if _cancelled():
+            _local.partial = True
+            break
+        if i < spec.skip or not isinstance(item, dict):
+            continue
+        job = _to_job(spec, item)
+        if job and _matches(job, _lookup(item, spec.fields.get("tags")), _lookup(item, spec.fields.get("description"))):
+            jobs.append(job)
     return jobs
 
 
-def fetch_realworkfromanywhere() -> list[dict]:
-    """Real Work From Anywhere RSS feeds."""
-    base = "https://www.realworkfromanywhere.com"
-    urls = [
-        f"{base}/rss.xml",
-        f"{base}/remote-developer-jobs/rss.xml",
-        f"{base}/remote-backend-jobs/rss.xml",
-    ]
-    jobs = []
-    for url in urls:
-        try:
-            feed = feedparser.parse(url, request_headers=REQUEST_HEADERS)
-            for entry in feed.get("entries") or []:
-                link = (entry.get("link") or "").strip()
-                title = (entry.get("title") or "").strip()
-                if not link:
-                    continue
-                summary = (entry.get("summary", "") or "").lower()
-                norm = _normalize("realworkfromanywhere", link, "", title, link)
-                if norm and _matches({"position": title, "title": title, "description": summary}):
-                    jobs.append(norm)
-        except Exception as e:
-            logger.warning("Real Work From Anywhere %s failed: %s", url, e)
+def fetch_source(spec: SourceSpec) -> list[Job]:
+    """
+    Fetch one source: each of its URLs (and pages) in turn, through the host's rate limiter.
+    A failed request is logged and ends that URL's pages; jobs already fetched are kept
+    (and _local.partial is set, so iter_jobs does not move the watermark past them).
+    Once cancelled it stops reading the current response too (_parse) and returns what it has.
+    Does not raise.
+    """
+    _local.partial = False
+    params = {**spec.params, **{name: getattr(config, attr) for name, attr in spec.secret_params.items()}}
+    jobs: list[Job] = []
+    for url in spec.urls:
+        for page in range(1, spec.pages + 1):
+            if _cancelled() or not _throttle(spec.host):
+                _local.partial = True
+                return jobs
+            page_params = {**params, spec.page_param: page} if spec.page_param else params
+            try:
+                if spec.conditional:
+                    jobs.extend(_conditional_get(url, lambda r: _parse(spec, r), page_params, spec.secret_params))
+                else:
+                    with http_client.get(url, params=page_params, stream=True) as r:
+                        r.raise_for_status()
+                        jobs.extend(_parse(spec, r))
+            except Exception as e:
+                logger.warning("%s fetch %s failed: %s", spec.label, url, e)
+                _local.partial = True
+                break
     return jobs
 
 
-def fetch_authenticjobs() -> list[dict]:
-    """Authentic Jobs API. Only if key set."""
-    if not config.AUTHENTICJOBS_API_KEY:
-        return []
-    try:
-        r = requests.get(
-            "https://authenticjobs.com/api/posts/search/",
-            params={"api_key": config.AUTHENTICJOBS_API_KEY, "keywords": "spring boot java"},
-            headers=REQUEST_HEADERS,
-            timeout=30,
-        )
-        r.raise_for_status()
-        data = r.json()
-        listings = data.get("listings") if isinstance(data, dict) else []
-        jobs = []
-        for item in listings or []:
-            if not isinstance(item, dict):
-                continue
-            url = (item.get("url") or item.get("apply_url") or "").strip()
-            if not url:
-                continue
-            company = item.get("company", {})
-            company_name = company.get("name", "") if isinstance(company, dict) else ""
-            norm = _normalize(
-                "authenticjobs",
-                item.get("id", ""),
-                company_name,
-                item.get("title", ""),
-                url,
-            )
-            if norm and _matches({**item, "position": item.get("title"), "company": company_name}):
-                jobs.append(norm)
-        return jobs
-    except Exception as e:
-        logger.warning("Authentic Jobs fetch failed: %s", e)
-        return []
-
-
-def dedupe_by_url(jobs: list[dict]) -> list[dict]:
+def dedupe_by_url(jobs: list[Job]) -> list[Job]:
     """Keep first occurrence of each job_url."""
     seen = set()
     out = []
     for j in jobs:
-        u = (j.get("url") or "").strip()
+        u = j.url
         if u and u not in seen:
             seen.add(u)
             out.append(j)
     return out
 
 
-def fetch_all_jobs() -> list[dict]:
-    """Fetch from all 10 sources, normalize, filter, dedupe."""
-    all_jobs = []
-    all_jobs.extend(fetch_remoteok())
-    all_jobs.extend(fetch_remotive())
-    all_jobs.extend(fetch_jobicy())
-    all_jobs.extend(fetch_working_nomads())
-    all_jobs.extend(fetch_jobscollider())
-    all_jobs.extend(fetch_wwr())
-    all_jobs.extend(fetch_adzuna())
-    all_jobs.extend(fetch_themuse())
-    all_jobs.extend(fetch_realworkfromanywhere())
-    all_jobs.extend(fetch_authenticjobs())
-    deduped = dedupe_by_url(all_jobs)
+def _run_source(spec: SourceSpec, cancel: threading.Event) -> tuple[list[Job], bool]:
+    """The source's jobs, and whether that is everything it lists (no request failed or was cancelled)."""
+    _local.cancel = cancel
+    try:
+        with metrics.timer("source_fetch_seconds", source=spec.name):
+            jobs = fetch_source(spec)
+        metrics.inc("source_jobs_total", len(jobs), source=spec.name)
+        return jobs, not _local.partial
+    finally:
+        _local.cancel = None
+
+
+def iter_jobs(
+    stop: threading.Event | None = None, seen: discovery_state.DiscoveryState | None = None
+) -> Iterator[Job]:
+    """
+    Yield normalized, filtered jobs as each source completes, deduped on the fly by URL and
+    across sources by company and title (src.dedupe).
+    With `seen`, only jobs newer than their source's watermark or due for a retry are yielded,
+    and a source's watermark may only move once its whole list has been gone through.
+    Setting `stop` ends the generator once the lists already fetched have been gone through;
+    closing it ends it at once. Either way sources still running are cancelled.
+    """
+    cancel = threading.Event()
+    urls: set[str] = set()
+    postings = dedupe.PostingIndex()
+    specs = sources.specs()
+    workers = max(1, min(config.DISCOVERY_WORKERS, len(specs)))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="discovery")
+    try:
+        futures = {pool.submit(_run_source, spec, cancel): spec for spec in specs}
+        pending = set(futures)
+        while pending:
+            if stop is not None and stop.is_set():
+                return
+            # Time out now and then so `stop` is noticed while a slow source is still running.
+            finished, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for fut in futures:
+                if fut not in finished:
+                    continue
+                jobs, whole = fut.result()
+                for job in jobs:
+                    url = job.url
+                    if not url or url in urls:
+                        continue
+                    urls.add(url)
+                    if postings.add(job) is not None:
+                        continue
+                    if seen is not None:
+                        if not seen.should_emit(job):
+                            continue
+                        seen.track(job)
+                    yield job
+                # Reached only if every job was looked at (the generator was not closed mid-list).
+                if seen is not None and whole:
+                    seen.complete(futures[fut].name)
+    finally:
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_all_jobs() -> list[Job]:
+    """
+    Fetch from every enabled source (sources.specs()), normalize, filter, dedupe.
+    Sources run in parallel (DISCOVERY_WORKERS threads); per-host limits live in rate_limit.
+    Results are merged in registry order so dedupe keeps the same job as a serial run.
+    """
+    specs = sources.specs()
+    workers = max(1, min(config.DISCOVERY_WORKERS, len(specs)))
+    if workers == 1:
+        results = [fetch_source(spec) for spec in specs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="discovery") as pool:
+            results = list(pool.map(fetch_source, specs))
+    all_jobs = [job for jobs in results for job in jobs]
+    deduped = dedupe.dedupe_postings(dedupe_by_url(all_jobs))
     logger.info("Fetched %d jobs after dedupe", len(deduped))
     return deduped
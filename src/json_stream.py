@@ -0,0 +1,57 @@
+"""
+Incremental parser for a top-level JSON array: yields elements one by one while the
+response body is still being read, so only the current element and one network chunk
+are in memory instead of the whole body and the whole decoded list.
+"""
+import codecs
+import itertools
+import json
+from typing import Iterable, Iterator
+
+CHUNK_SIZE = 64 * 1024
+
+# Skipped between elements (separators are not checked strictly).
+_BETWEEN = " \t\n\r,"
+
+
+def iter_array(chunks: Iterable[bytes]) -> Iterator:
+    """
+    Yield the elements of a JSON array from byte chunks (e.g. response.iter_content()).
+    Raises ValueError if the input is not a JSON array or ends before it is closed.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buf = ""
+    pos = 0
+    started = False
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        # Drop what was consumed; keep the unfinished element.
+        buf = buf[pos:] + text.decode(chunk or b"", final=final)
+        pos = 0
+        while True:
+            skip = _BETWEEN if started else " \t\n\r\ufeff"
+            while pos < len(buf) and buf[pos] in skip:
+                pos += 1
+            if pos >= len(buf):
+                break
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # element not complete yet: read more
+            scalar = not isinstance(value, (dict, list, str))
+            if scalar and not final and (end == len(buf) or buf[end] not in _BETWEEN + "]"):
+                break  # a number may continue in the next chunk ("2." of "2.5")
+            yield value
+            pos = end
+    raise ValueError("JSON array not closed" if started else "expected a JSON array")
@@ -0,0 +1,113 @@
+"""
+Keyword matcher compiled once into a single regex alternation.
+Terms match on word boundaries (letters/digits), case-insensitively; spaces in a term also
+match "-", "_" or nothing ("spring boot" ~ "spring-boot" ~ "springboot").
+Negative terms take the text they match away from positive ones, so "javascript" never
+counts as "java". Each field has a weight; the score is the weighted count of distinct
+positive terms per field.
+"""
+import re
+from typing import Iterable
+
+DEFAULT_WEIGHTS = {"title": 3, "tags": 2, "company": 1, "description": 1}
+
+
+def _is_word_char(c: str) -> bool:
+    return "a" <= c <= "z" or "0" <= c <= "9"
+
+
+def _term_pattern(term: str) -> str:
+    words = term.lower().split()
+    return r"[\s\-_]*".join(re.escape(w) for w in words)
+
+
+class KeywordMatcher:
+    """Compiled positive/negative keyword set with per-field weights."""
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        negative: Iterable[str] = (),
+        weights: dict[str, int] | None = None,
+        threshold: int = 1,
+    ) -> None:
+        positive = {k.strip().lower() for k in keywords if k and k.strip()}
+        negative = {k.strip().lower() for k in negative if k and k.strip()} - positive
+        self.keywords = tuple(sorted(positive))
+        self.weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        self.threshold = threshold
+        # Longest terms first: at a given position the longer term (e.g. a negative one) wins.
+        terms = sorted(positive | negative, key=len, reverse=True)
+        self._negative = negative
+        self._canonical = {}
+        groups = []
+        for i, term in enumerate(terms):
+            groups.append(f"(?P<t{i}>{_term_pattern(term)})")
+            self._canonical[f"t{i}"] = term
+        alternation = "|".join(groups) if groups else r"(?!x)x"
+        # Text is lowercased before matching (cheaper than re.IGNORECASE).
+        self._regex = re.compile(rf"(?:{alternation})(?![a-z0-9])")
+        # Every match starts with its term's first word verbatim. hits() finds those anchors
+        # with str.find and only runs the regex there, instead of at every character.
+        self._anchors = tuple({term.split()[0] for term in terms})
+        self._positive_anchors = tuple({term.split()[0] for term in positive})
+
+    def _starts(self, text: str) -> list[int]:
+        starts = []
+        for anchor in self._anchors:
+            i = text.find(anchor)
+            while i != -1:
+                starts.append(i)
+                i = text.find(anchor, i + 1)
+        starts.sort()
+        return starts
+
+    def hits(self, text: str, stop_after: int | None = None) -> set[str]:
+        """Distinct positive keywords found in text (at most stop_after of them, if given)."""
+        found = set()
+        if not text:
+            return found
+        text = text.lower()
+        if not any(anchor in text for anchor in self._positive_anchors):
+            return found
+        match = self._regex.match
+        consumed = 0
+        # Same leftmost, non-overlapping scan as finditer, visiting only anchor positions.
+        for start in self._starts(text):
+            if start < consumed or (start and _is_word_char(text[start - 1])):
+                continue
+            m = match(text, start)
+            if m is None:
+                continue
+            consumed = m.end()
+            term = self._canonical[m.lastgroup]
+            if term not in self._negative:
+                found.add(term)
+                if stop_after is not None and len(found) >= stop_after:
+                    break
+        return found
+
+    def score(self, fields: dict[str, str | Iterable[str] | None], limit: int | None = None) -> int:
+        """
+        Weighted hits over fields ({"title": ..., "tags": [...], ...}); unknown fields weigh 1.
+        With limit, stops as soon as the score reaches it.
+        """
+        total = 0
+        for name, value in fields.items():
+            if not value:
+                continue
+            text = value if isinstance(value, str) else " ".join(str(v) for v in value)
+            weight = self.weights.get(name, 1)
+            stop_after = None
+            if limit is not None and weight > 0:
+                stop_after = -(-(limit - total) // weight)  # hits still needed, rounded up
+            found = self.hits(text, stop_after)
+            if found:
+                total += weight * len(found)
+                if limit is not None and total >= limit:
+                    return total
+        return total
+
+    def matches(self, fields: dict[str, str | Iterable[str] | None]) -> bool:
+        """True if the weighted score reaches the threshold."""
+        return self.score(fields, limit=self.threshold) >= self.threshold
@@ -0,0 +1,155 @@
+"""
+Run metrics: counters, timers and gauges with labels, shared by every thread.
+Exported at the end of a run as JSON and as a Prometheus textfile (node_exporter
+textfile collector format) under METRICS_DIR.
+
+    metrics.inc("cache_hits_total", cache="hunter_domains")
+    with metrics.timer("hunter_request_seconds", endpoint="domain-search"):
+        ...
+"""
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+import config
+from src import atomic_file
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "autojobs_"
+
+Labels = tuple[tuple[str, str], ...]
+
+_lock = threading.Lock()
+_counters: dict[str, dict[Labels, float]] = {}
+_timers: dict[str, dict[Labels, list[float]]] = {}  # [count, sum, max]
+_gauges: dict[str, dict[Labels, float]] = {}
+_started = time.time()
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    """Add value to a counter."""
+    key = _labels(labels)
+    with _lock:
+        series = _counters.setdefault(name, {})
+        series[key] = series.get(key, 0) + value
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    """Record one duration in a timer."""
+    key = _labels(labels)
+    with _lock:
+        stats = _timers.setdefault(name, {}).setdefault(key, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    with _lock:
+        _gauges.setdefault(name, {})[_labels(labels)] = value
+
+
+@contextmanager
+def timer(name: str, **labels) -> Iterator[None]:
+    """Time the block (also when it raises)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def timed(name: str, **labels):
+    """Decorator form of timer()."""
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timer(name, **labels):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def reset() -> None:
+    global _started
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+        _gauges.clear()
+        _started = time.time()
+
+
+def _label_text(labels: Labels) -> str:
+    return ",".join(f"{k}={v}" for k, v in labels)
+
+
+def snapshot() -> dict:
+    """Everything recorded so far: {"counters": {name: {"k=v,...": value}}, "timers": ..., "gauges": ...}."""
+    with _lock:
+        return {
+            "started_at": datetime.utcfromtimestamp(_started).isoformat() + "Z",
+            "finished_at": datetime.utcnow().isoformat() + "Z",
+            "counters": {n: {_label_text(k): v for k, v in s.items()} for n, s in sorted(_counters.items())},
+            "timers": {
+                n: {_label_text(k): {"count": c, "sum": total, "max": peak} for k, (c, total, peak) in s.items()}
+                for n, s in sorted(_timers.items())
+            },
+            "gauges": {n: {_label_text(k): v for k, v in s.items()} for n, s in sorted(_gauges.items())},
+        }
+
+
+def _prom_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+def prometheus_text() -> str:
+    """Prometheus exposition format; timers become summaries (_count, _sum) plus a _max gauge."""
+    lines = []
+    with _lock:
+        for name, series in sorted(_counters.items()):
+            lines.append(f"# TYPE {PREFIX}{name} counter")
+            lines.extend(f"{PREFIX}{name}{_prom_labels(k)} {v:g}" for k, v in sorted(series.items()))
+        for name, series in sorted(_timers.items()):
+            lines.append(f"# TYPE {PREFIX}{name} summary")
+            for k, (count, total, _) in sorted(series.items()):
+                lines.append(f"{PREFIX}{name}_count{_prom_labels(k)} {count:g}")
+                lines.append(f"{PREFIX}{name}_sum{_prom_labels(k)} {total:.6f}")
+            lines.append(f"# TYPE {PREFIX}{name}_max gauge")
+            lines.extend(f"{PREFIX}{name}_max{_prom_labels(k)} {s[2]:.6f}" for k, s in sorted(series.items()))
+        for name, series in sorted(_gauges.items()):
+            lines.append(f"# TYPE {PREFIX}{name} gauge")
+            lines.extend(f"{PREFIX}{name}{_prom_labels(k)} {v:g}" for k, v in sorted(series.items()))
+    lines.append(f"# TYPE {PREFIX}last_run_timestamp_seconds gauge")
+    lines.append(f"{PREFIX}last_run_timestamp_seconds {time.time():.0f}")
+    return "\n".join(lines) + "\n"
+
+
+def export(directory: Path | None = None) -> None:
+    """Write metrics.json and metrics.prom to directory (METRICS_DIR). Logs, never raises."""
+    directory = directory or config.METRICS_DIR
+    if not directory:
+        return
+    directory = Path(directory)
+    set_gauge("run_duration_seconds", time.time() - _started)
+    try:
+        atomic_file.write_json(directory / "metrics.json", snapshot(), indent=2)
+        atomic_file.write_text(directory / "metrics.prom", prometheus_text())
+        logger.info("Metrics written to %s", directory)
+    except OSError as e:
+        logger.warning("Could not write metrics to %s: %s", directory, e)
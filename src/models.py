@@ -0,0 +1,51 @@
+"""
+Compact job record shared by discovery, ranking, dedupe and the pipeline.
+Slots instead of a per-job dict; source names are interned so every job from a source
+points at the same string.
+"""
+import sys
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Job:
+    """One normalized posting. published is "YYYY-MM-DDTHH:MM:SSZ" (UTC) or ""."""
+
+    source: str
+    id: str
+    company: str
+    position: str
+    url: str
+    published: str = ""
+    # Weighted keyword score from discovery (see job_discovery.MATCHER), used for ranking.
+    match_score: int = 0
+    # Other sources the same posting was found on (see dedupe).
+    merged_sources: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        self.source = sys.intern(self.source)
+
+    def to_dict(self) -> dict:
+        """Plain dict for JSON caches."""
+        return {
+            "source": self.source,
+            "id": self.id,
+            "company": self.company,
+            "position": self.position,
+            "url": self.url,
+            "published": self.published,
+            "match_score": self.match_score,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Job":
+        """Inverse of to_dict; missing fields get their defaults."""
+        return cls(
+            source=data.get("source") or "",
+            id=str(data.get("id") or ""),
+            company=data.get("company") or "",
+            position=data.get("position") or "",
+            url=data.get("url") or "",
+            published=data.get("published") or "",
+            match_score=int(data.get("match_score") or 0),
+        )
@@ -0,0 +1,380 @@
+"""
+Staged application pipeline: discover -> resolve -> verify -> send -> report/persist.
+Stages run in their own worker threads joined by bounded queues, so network waits overlap:
+jobs from the first source to finish are resolved and sent while slower sources still fetch.
+"""
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from contextlib import closing
+from pathlib import Path
+from typing import Callable
+
+import config
+from src import discovery_state, email_finder, email_sender, email_verifier, job_discovery, metrics, ranking, state, telegram_notifier
+from src.domain_resolver import slugify
+from src.models import Job
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _Stage:
+    """
+    `workers` threads taking items from in_q, calling handle(batch) and putting each
+    returned item on out_q. When the last worker sees the end marker, it is passed on.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handle: Callable[[list], list],
+        in_q: queue.Queue,
+        out_q: queue.Queue | None,
+        workers: int = 1,
+        batch_size: int = 1,
+    ) -> None:
+        self.name = name
+        self.handle = handle
+        self.in_q = in_q
+        self.out_q = out_q
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.next: "_Stage | None" = None
+        self.busy = 0.0  # seconds spent in handle(), summed over workers
+        self.items = 0  # items handled
+        self._alive = self.workers
+        self._lock = threading.Lock()
+        self.threads = [
+            threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True) for i in range(self.workers)
+        ]
+
+    def start(self) -> None:
+        for t in self.threads:
+            t.start()
+
+    def _take_batch(self) -> tuple[list, bool]:
+        """Block for one item, then grab whatever else is already queued, up to batch_size."""
+        first = self.in_q.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                item = self.in_q.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            batch, stopped = self._take_batch()
+            if not batch:
+                continue
+            start = time.perf_counter()
+            try:
+                results = self.handle(batch)
+            except Exception as e:
+                logger.warning("Pipeline stage %s failed: %s", self.name, e)
+                continue
+            finally:
+                with self._lock:
+                    self.busy += time.perf_counter() - start
+                    self.items += len(batch)
+            if self.out_q is not None:
+                for item in results:
+                    self.out_q.put(item)
+        with self._lock:
+            self._alive -= 1
+            last = self._alive == 0
+        if last and self.next is not None:
+            for _ in range(self.next.workers):
+                self.next.in_q.put(_STOP)
+
+    def join(self) -> None:
+        for t in self.threads:
+            t.join()
+
+
+class Pipeline:
+    """One run: applies to at most `cap` jobs, exactly as the serial loop did."""
+
+    def __init__(
+        self,
+        applied: state.ApplicationIndex,
+        state_path: Path,
+        smtp: email_sender.SmtpSession,
+        cap: int,
+        seen: discovery_state.DiscoveryState | None = None,
+        reporter: telegram_notifier.Reporter | None = None,
+    ) -> None:
+        self.applied = applied
+        self.reporter = reporter
+        self.seen = seen
+        self.state_path = state_path
+        self.smtp = smtp
+        self.cap = cap
+        self.sent = 0
+        self.discovered = 0
+        self.skipped: Counter = Counter()
+        self.timings: dict[str, float] = {}
+        self.items: dict[str, int] = {}
+        self._skip_lock = threading.Lock()
+        # Companies queued and emails sent this run: one application per company per run.
+        self._queued_companies: set[str] = set()
+        self._sent_emails: set[str] = set()
+        # Set once the cap is reached: upstream stages stop doing work and just drain.
+        self.done = threading.Event()
+        size = max(1, config.PIPELINE_QUEUE_SIZE)
+        resolve_q: queue.Queue = queue.Queue(maxsize=size)
+        verify_q: queue.Queue = queue.Queue(maxsize=size)
+        send_q: queue.Queue = queue.Queue(maxsize=size)
+        report_q: queue.Queue = queue.Queue()
+        self.stages = [
+            _Stage("resolve", self._resolve, resolve_q, verify_q, workers=config.PIPELINE_RESOLVE_WORKERS),
+            _Stage(
+                "verify",
+                self._verify,
+                verify_q,
+                send_q,
+                workers=config.PIPELINE_VERIFY_WORKERS,
+                batch_size=config.VERIFY_BATCH_SIZE,
+            ),
+            # One sender: it alone counts applications, so the cap is exact.
+            _Stage("send", self._send, send_q, report_q),
+            _Stage("report", self._report, report_q, None),
+        ]
+        for stage, nxt in zip(self.stages, self.stages[1:]):
+            stage.next = nxt
+
+    def run(self) -> int:
+        """Run all stages to completion. Returns the number of applications sent."""
+        for stage in self.stages:
+            stage.start()
+        start = time.perf_counter()
+        try:
+            self._discover(self.stages[0])
+        finally:
+            self.timings["discover"] = time.perf_counter() - start
+            for _ in range(self.stages[0].workers):
+                self.stages[0].in_q.put(_STOP)
+            for stage in self.stages:
+                stage.join()
+                self.timings[stage.name] = stage.busy
+                self.items[stage.name] = stage.items
+                metrics.set_gauge("pipeline_stage_busy_seconds", stage.busy, stage=stage.name)
+                metrics.set_gauge("pipeline_stage_items", stage.items, stage=stage.name)
+            self.timings["total"] = time.perf_counter() - start
+            metrics.set_gauge("pipeline_stage_busy_seconds", self.timings["discover"], stage="discover")
+            metrics.set_gauge("jobs_discovered", self.discovered)
+        if self.sent >= self.cap:
+            logger.info("Reached cap of %d applications, stopping", self.cap)
+        if self.reporter is not None:
+            self.reporter.post(telegram_notifier.format_digest(self.summary()))
+        return self.sent
+
+    def summary(self) -> dict:
+        """Counts, skip reasons, per-stage busy time (seconds) and items handled per stage."""
+        return {
+            "applied": self.sent,
+            "cap": self.cap,
+            "discovered": self.discovered,
+            "skipped": dict(self.skipped),
+            "timings": dict(self.timings),
+            "items": dict(self.items),
+        }
+
+    def _discover(self, resolve: _Stage) -> None:
+        """
+        Feed jobs downstream as each source finishes (job_discovery.iter_jobs).
+        Once the cap is reached the iterator stops after the lists in hand, cancelling sources still running.
+        With ranking on (RANK_TOP_K_FACTOR), jobs instead go into a shortlist of the best
+        cap x factor, fed best first once every source is in: the cap goes to the most
+        relevant jobs, not to the fastest sources, at the cost of lookups not overlapping
+        discovery. RANK_TOP_K_FACTOR=0 feeds jobs in arrival order as sources finish.
+        Jobs at companies contacted within CONTACT_COOLDOWN_DAYS are dropped here, before
+        any domain resolution; of several jobs at one company only the first (or best) goes on.
+        """
+        k = ranking.shortlist_size(self.cap)
+        shortlist = ranking.Shortlist(k) if k else None
+        left_out = 0
+        total = 0
+        with closing(job_discovery.iter_jobs(stop=self.done, seen=self.seen)) as jobs:
+            for job in jobs:
+                if self.done.is_set():
+                    # Cap reached: iter_jobs goes through the lists already fetched (so their
+                    # watermarks move and these jobs stay pending) and then stops.
+                    continue
+                total += 1
+                url = job.url
+                if self.applied.contains(url, job.source, job.id):
+                    logger.debug("Skipped (already applied): %s", url[:60])
+                    self._count_skip("already_applied")
+                    self._handled(job)
+                    continue
+                if self.applied.recently_contacted(job.company):
+                    logger.info("Skipped (contacted %s recently): %s", job.company[:40], url[:60])
+                    self._reject(job, "recently_contacted")
+                    continue
+                if shortlist is None:
+                    self._feed(resolve, job)
+                elif shortlist.push(job) is not None:
+                    left_out += 1
+        self.discovered = total
+        logger.info("Fetched %d jobs after dedupe", total)
+        if shortlist is not None:
+            fed = 0
+            for job in shortlist.best():
+                if self.done.is_set():
+                    break
+                fed += self._feed(resolve, job)
+            # Jobs left out are not marked handled, so discovery_state keeps them pending for the next runs.
+            if left_out:
+                self._count_skip("not_shortlisted", left_out)
+            logger.info("Ranked %d new jobs, fed the best %d", left_out + len(shortlist), fed)
+
+    def _feed(self, resolve: _Stage, job: Job) -> bool:
+        slug = slugify(job.company)
+        if slug:
+            if slug in self._queued_companies:
+                logger.debug("Skipped (company already queued this run): %s", job.url[:60])
+                self._count_skip("same_company")
+                return False
+            self._queued_companies.add(slug)
+        resolve.in_q.put(job)
+        return True
+
+    def _count_skip(self, reason: str, n: int = 1) -> None:
+        with self._skip_lock:
+            self.skipped[reason] += n
+        metrics.inc("jobs_skipped_total", n, reason=reason)
+
+    def _reject(self, job: Job, reason: str) -> None:
+        self._count_skip(reason)
+        if self.seen is not None:
+            self.seen.reject(job, reason)
+
+    def _handled(self, job: Job) -> None:
+        if self.seen is not None:
+            self.seen.mark_handled(job)
+
+    def _resolve(self, batch: list[Job]) -> list[tuple]:
+        out = []
+        for job in batch:
+            if self.done.is_set():
+                continue
+            company = job.company
+            if not company:
+                self._reject(job, "no_company")
+                continue
+            to_email = email_finder.find_email_for_company(company)
+            if not to_email:
+                logger.info("No email for domain (company: %s), skip", company[:40])
+                self._reject(job, "no_email")
+                continue
+            out.append((job, company, to_email))
+        return out
+
+    def _verify(self, batch: list[tuple]) -> list[tuple]:
+        if self.done.is_set():
+            return []
+        deliverable = email_verifier.verify_many([to_email for _, _, to_email in batch])
+        out = []
+        for job, company, to_email in batch:
+            ok = deliverable.get(to_email.strip().lower(), False)
+            if ok is None:
+                # Hunter request failed, status 'unknown' or no verification credit left: not a
+                # dead end, so no rejection; the job stays pending for the next run.
+                logger.info("Could not verify %s (company: %s), skip for this run", to_email, company[:40])
+                self._count_skip("verify_failed")
+                continue
+            if not ok:
+                logger.info("Email not deliverable, skip %s (company: %s)", to_email, company[:40])
+                self._reject(job, "not_deliverable")
+                continue
+            out.append((job, company, to_email))
+        return out
+
+    def _send(self, batch: list[tuple]) -> list[tuple]:
+        out = []
+        for job, company, to_email in batch:
+            if self.sent >= self.cap:
+                continue
+            # Different company names can resolve to the same address; check again right before sending.
+            email = to_email.strip().lower()
+            if email in self._sent_emails or self.applied.recently_contacted(company, email):
+                logger.info("Skipped (already contacted %s)", to_email)
+                self._reject(job, "recently_contacted")
+                continue
+            position = job.position or "Spring Boot Developer"
+            if not self.smtp.send(to_email, company, position):
+                metrics.inc("applications_total", outcome="send_failed")
+                continue
+            metrics.inc("applications_total", outcome="sent")
+            self.sent += 1
+            self._sent_emails.add(email)
+            if self.sent >= self.cap:
+                self.done.set()
+            out.append((job, company, to_email, position))
+        return out
+
+    def _report(self, batch: list[tuple]) -> list:
+        """
+        Persist each sent application, then report it. The email is already out, so the
+        record is written first and each item is handled on its own: a failed write or
+        report never loses the other records in the batch.
+        """
+        for job, company, to_email, position in batch:
+            job_url = job.url
+            try:
+                state.append_applied(
+                    job.source,
+                    job.id,
+                    job_url,
+                    company,
+                    self.applied,
+                    self.state_path,
+                    to_email=to_email,
+                )
+            except Exception as e:
+                # Still reported below: the email went out either way.
+                logger.error("Could not record application to %s (%s): %s", company, job_url, e)
+            else:
+                self._handled(job)
+                logger.info("Applied to %s (%s)", company, job_url[:50])
+            source = job.source
+            if job.merged_sources:
+                source += f" (also on {', '.join(job.merged_sources)})"
+            try:
+                if self.reporter is not None:
+                    self.reporter.report(position, company, job_url, to_email, source)
+                else:
+                    telegram_notifier.send_telegram_report(position, company, job_url, to_email, source)
+            except Exception as e:
+                logger.warning("Could not report application to %s: %s", company, e)
+        return []
+
+
+def run(
+    applied: state.ApplicationIndex,
+    state_path: Path,
+    smtp: email_sender.SmtpSession,
+    cap: int,
+    seen: discovery_state.DiscoveryState | None = None,
+    reporter: telegram_notifier.Reporter | None = None,
+) -> dict:
+    """
+    Run one pipeline; returns its summary (Pipeline.summary: "applied" is the number sent).
+    With a reporter, Telegram reports are sent in the background and a digest follows the run.
+    """
+    pipe = Pipeline(applied, state_path, smtp, cap, seen, reporter)
+    if cap > 0:
+        pipe.run()
+    return pipe.summary()
@@ -0,0 +1,91 @@
+"""
+Relevance ranking of discovered jobs, so Hunter lookups and SMTP sends go to the best
+postings first instead of whichever source happened to answer first.
+score = keyword score (weighted hits per field, from job_discovery.MATCHER)
+      + recency (RECENCY_WEIGHT, halving every RECENCY_HALF_LIFE_DAYS)
+      + source quality (SOURCE_QUALITY, fixed per-source priors; nothing measures or updates them).
+"""
+import heapq
+import itertools
+import math
+from datetime import datetime
+
+import config
+from src.models import Job
+
+# Static priors, set by hand: postings from curated remote boards usually name the company
+# and link to its site, while aggregators and feeds without a company field rarely lead to a
+# reachable address. Adjust them here; they are not learned from applied/rejected history.
+SOURCE_QUALITY: dict[str, float] = {
+    "remotive": 2.0,
+    "wwr": 2.0,
+    "jobicy": 1.5,
+    "remoteok": 1.5,
+    "workingnomads": 1.5,
+    "themuse": 1.5,
+    "authenticjobs": 1.0,
+    "jobscollider": 1.0,
+    "adzuna": 0.5,
+    "realworkfromanywhere": 0.5,
+}
+DEFAULT_SOURCE_QUALITY = 1.0
+
+RECENCY_WEIGHT = 3.0
+RECENCY_HALF_LIFE_DAYS = 7.0
+# Postings without a date get the recency of one this many days old.
+UNDATED_AGE_DAYS = 14.0
+
+
+def _age_days(published: str, now: datetime) -> float:
+    try:
+        when = datetime.strptime(published, "%Y-%m-%dT%H:%M:%SZ")
+    except (TypeError, ValueError):
+        return UNDATED_AGE_DAYS
+    return max(0.0, (now - when).total_seconds() / 86400)
+
+
+def score(job: Job, now: datetime | None = None) -> float:
+    """Relevance of one normalized job (higher is better)."""
+    now = now or datetime.utcnow()
+    recency = RECENCY_WEIGHT * math.pow(0.5, _age_days(job.published, now) / RECENCY_HALF_LIFE_DAYS)
+    quality = SOURCE_QUALITY.get(job.source, DEFAULT_SOURCE_QUALITY)
+    return job.match_score + recency + quality
+
+
+class Shortlist:
+    """
+    The `size` best jobs seen so far, for jobs that arrive over time: a min-heap on score
+    capped at size, so the weakest kept job is dropped when a better one comes in. Read
+    the result with best() once every source is in. Ties keep discovery order.
+    """
+
+    def __init__(self, size: int, now: datetime | None = None) -> None:
+        self.size = size
+        self.now = now or datetime.utcnow()
+        self._heap: list[tuple[float, int, Job]] = []
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, job: Job) -> Job | None:
+        """Keep job if it is among the best `size`; returns the job left out (it or a weaker one), or None."""
+        # Later arrivals get a lower tie-break, so on equal scores they are the ones dropped.
+        entry = (score(job, self.now), -next(self._seq), job)
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, entry)
+            return None
+        if self.size <= 0 or entry[:2] <= self._heap[0][:2]:
+            return job
+        return heapq.heapreplace(self._heap, entry)[2]
+
+    def best(self) -> list[Job]:
+        """The kept jobs, best first."""
+        return [job for _, _, job in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
+def shortlist_size(cap: int) -> int:
+    """How many ranked jobs to look at for `cap` applications (0 = ranking disabled)."""
+    if cap <= 0 or config.RANK_TOP_K_FACTOR <= 0:
+        return 0
+    return cap * config.RANK_TOP_K_FACTOR
@@ -0,0 +1,74 @@
+"""
+Per-host token-bucket rate limiters, shared by every thread in the process.
+"""
+import threading
+import time
+
+import config
+from src import metrics
+
+# host -> (requests per second, burst capacity). Job sources add theirs from their
+# SourceSpec.rate_limit when loaded (src.sources.load).
+HOST_LIMITS: dict[str, tuple[float, float]] = {
+    "api.hunter.io": (config.HUNTER_REQUESTS_PER_MINUTE / 60, 3),
+    "api.telegram.org": (20 / 60, 3),  # Bot API flood limit for groups: 20 messages/min
+}
+
+
+class TokenBucket:
+    """Allow `rate` requests per second on average, with bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel: threading.Event | None = None) -> bool:
+        """
+        Block until one token is available, then take it.
+        Returns False (without taking a token) if cancel is set while waiting.
+        """
+        while True:
+            if cancel is not None and cancel.is_set():
+                return False
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                delay = (1 - self._tokens) / self.rate
+            if cancel is not None:
+                cancel.wait(delay)
+            else:
+                time.sleep(delay)
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def limiter(host: str) -> TokenBucket | None:
+    """Return the shared bucket for host, or None if the host is not rate limited (or RATE_LIMITS=0)."""
+    if not config.RATE_LIMITS:
+        return None
+    limit = HOST_LIMITS.get(host)
+    if limit is None:
+        return None
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(*limit)
+        return bucket
+
+
+def wait(host: str, cancel: threading.Event | None = None) -> bool:
+    """Block until a request to host is allowed. False if cancel was set first."""
+    bucket = limiter(host)
+    if bucket is None:
+        return not (cancel is not None and cancel.is_set())
+    with metrics.timer("rate_limit_wait_seconds", host=host):
+        return bucket.acquire(cancel)
@@ -0,0 +1,103 @@
+"""
+Job source registry. Each source is a declarative SourceSpec in its own module here
+(URL, params, pagination, where the postings are, field map, rate limit, required keys);
+job_discovery.fetch_source runs any of them.
+
+Modules are imported only when their source is enabled (JOB_SOURCES), so disabled
+sources are never loaded or run. Adding a source is a new module plus a REGISTRY entry.
+"""
+import importlib
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+import config
+from src import rate_limit
+
+logger = logging.getLogger(__name__)
+
+# Source name (Job.source, JOB_SOURCES) -> module under src.sources defining SPEC.
+# Results are merged in this order, so on duplicates the earlier source wins.
+REGISTRY: dict[str, str] = {
+    "remoteok": "remoteok",
+    "remotive": "remotive",
+    "jobicy": "jobicy",
+    "workingnomads": "workingnomads",
+    "jobscollider": "jobscollider",
+    "wwr": "wwr",
+    "adzuna": "adzuna",
+    "themuse": "themuse",
+    "realworkfromanywhere": "realworkfromanywhere",
+    "authenticjobs": "authenticjobs",
+}
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """
+    How to fetch and read one source. Field paths are dotted ("company.name"); "a|b" takes
+    the first non-empty one. fields maps id, company, position, url, published, and the
+    tags / description used only for matching.
+    """
+
+    name: str
+    label: str
+    urls: tuple[str, ...]
+    fields: dict[str, str]
+    # "json", "json_stream" (top-level array parsed while it downloads) or "rss"
+    format: str = "json"
+    params: dict = field(default_factory=dict)
+    # Query parameter -> config attribute holding its value (API keys)
+    secret_params: dict[str, str] = field(default_factory=dict)
+    # Config attributes that must be set, else the source is skipped
+    requires: tuple[str, ...] = ()
+    # Pagination: pages 1..pages passed as page_param
+    page_param: str = ""
+    pages: int = 1
+    # Path to the list of postings in a JSON response ("" = the response itself)
+    items: str = ""
+    # Leading array elements that are not postings (RemoteOK's legal notice)
+    skip: int = 0
+    # Titles written "Company<sep>Position" (RSS feeds without a company field)
+    company_in_title: str = ""
+    # (requests per second, burst) for the host; None = not limited
+    rate_limit: tuple[float, float] | None = None
+    # Conditional GET with ETag / Last-Modified, parsed jobs reused on 304 (dumps and feeds)
+    conditional: bool = False
+
+    @property
+    def host(self) -> str:
+        return urlsplit(self.urls[0]).hostname or ""
+
+    def configured(self) -> bool:
+        return all(getattr(config, name, "") for name in self.requires)
+
+
+@lru_cache(maxsize=None)
+def load(name: str) -> SourceSpec:
+    """Import the source's module and register its host rate limit."""
+    spec = importlib.import_module(f"{__name__}.{REGISTRY[name]}").SPEC
+    if spec.rate_limit is not None:
+        rate_limit.HOST_LIMITS.setdefault(spec.host, spec.rate_limit)
+    return spec
+
+
+def enabled() -> list[str]:
+    """Names in JOB_SOURCES, in REGISTRY order. Unknown names are logged and ignored."""
+    unknown = [name for name in config.JOB_SOURCES if name not in REGISTRY]
+    if unknown:
+        logger.warning("Unknown job sources in JOB_SOURCES: %s", ", ".join(unknown))
+    return [name for name in REGISTRY if name in config.JOB_SOURCES]
+
+
+def specs() -> list[SourceSpec]:
+    """Specs of the enabled sources that have their required keys."""
+    out = []
+    for name in enabled():
+        spec = load(name)
+        if spec.configured():
+            out.append(spec)
+        else:
+            logger.debug("Source %s skipped (%s not set)", name, ", ".join(spec.requires))
+    return out
@@ -0,0 +1,25 @@
+"""Adzuna API (UK and US search). Only if keys set."""
+from src.sources import SourceSpec
+
+SPEC = SourceSpec(
+    name="adzuna",
+    label="Adzuna",
+    urls=(
+        "https://api.adzuna.com/v1/api/jobs/gb/search/1",
+        "https://api.adzuna.com/v1/api/jobs/us/search/1",
+    ),
+    params={"what": "spring boot java backend"},
+    secret_params={"app_id": "ADZUNA_APP_ID", "app_key": "ADZUNA_APP_KEY"},
+    requires=("ADZUNA_APP_ID", "ADZUNA_APP_KEY"),
+    items="results",
+    rate_limit=(1 / 2, 1),  # 2s between requests
+    fields={
+        "id": "id",
+        "company": "company.display_name",
+        "position": "title",
+        "url": "redirect_url|url",
+        "published": "created",
+        "tags": "tags",
+        "description": "description",
+    },
+)
@@ -0,0 +1,21 @@
+"""Authentic Jobs API. Only if key set."""
+from src.sources import SourceSpec
+
+SPEC = SourceSpec(
+    name="authenticjobs",
+    label="Authentic Jobs",
+    urls=("https://authenticjobs.com/api/posts/search/",),
+    params={"keywords": "spring boot java"},
+    secret_params={"api_key": "AUTHENTICJOBS_API_KEY"},
+    requires=("AUTHENTICJOBS_API_KEY",),
+    items="listings",
+    fields={
+        "id": "id",
+        "company": "company.name",
+        "position": "title",
+        "url": "url|apply_url",
+        "published": "post_date",
+        "tags": "tags",
+        "description": "description",
+    },
+)
@@ -0,0 +1,20 @@
+"""Jobicy API."""
+from src.sources import SourceSpec
+
+SPEC = SourceSpec(
+    name="jobicy",
+    label="Jobicy",
+    urls=("https://jobicy.com/api/v2/remote-jobs",),
+    params={"tag": "spring boot", "count": 100},
+    items="jobs",
+    rate_limit=(2 / 60, 1),
+    fields={
+        "id": "id",
+        "company": "companyName",
+        "position": "jobTitle",
+        "url": "url",
+        "published": "pubDate",
+        "tags": "tags",
+        "description": "description",
+    },
+)
@@ -0,0 +1,20 @@
+"""JobsCollider API."""
+from src.sources import SourceSpec
+
+SPEC = SourceSpec(
+    name="jobscollider",
+    label="JobsCollider",
+    urls=("https://jobscollider.com/api/search-jobs",),
+    params={"query": "spring boot", "category": "software_development"},
+    items="jobs",
+    rate_limit=(1 / 5, 1),
+    fields={
+        "id": "id",
+        "company": "company_name",
+        "position": "title",
+        "url": "url",
+        "published": "published_at|date",
+        "tags": "tags",
+        "description": "description",
+    },
+)
@@ -0,0 +1,19 @@
+"""Real Work From Anywhere RSS feeds (no company field)."""
+from src.sources import SourceSpec
+
+_BASE = "https://www.realworkfromanywhere.com"
+
+SPEC = SourceSpec(
+    name="realworkfromanywhere",
+    label="Real Work From Anywhere",
+    urls=(f"{_BASE}/rss.xml", f"{_BASE}/remote-developer-jobs/rss.xml", f"{_BASE}/remote-backend-jobs/rss.xml"),
+    format="rss",
+    conditional=True,
+    fields={
+        "id": "link",
+        "position": "title",
+        "url": "link",
+        "published": "published_parsed",
+        "description": "summary",
+    },
+)
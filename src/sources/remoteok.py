@@ -0,0 +1,20 @@
+"""RemoteOK API: one JSON array of every posting; the first element is metadata."""
+from src.sources import SourceSpec
+
+SPEC = SourceSpec(
+    name="remoteok",
+    label="RemoteOK",
+    urls=("https://remoteok.com/api",),
+    format="json_stream",
+    skip=1,
+    conditional=True,
+    fields={
+        "id": "id",
+        "company": "company",
+        "position": "position",
+        "url": "url|apply_url",
+        "published": "date|epoch",
+        "tags": "tags",
+        "description": "description",
+    },
+)
@@ -0,0 +1,20 @@
+"""Remotive API. Rate: max 2 req/min."""
+from src.sources import SourceSpec
+
+SPEC = SourceSpec(
+    name="remotive",
+    label="Remotive",
+    urls=("https://remotive.com/api/remote-jobs",),
+    params={"category": "software-dev", "search": "spring boot", "limit": 100},
+    items="jobs",
+    rate_limit=(2 / 60, 1),
+    fields={
+        "id": "id",
+        "company": "company_name",
+        "position": "title",
+        "url": "url",
+        "published": "publication_date",
+        "tags": "tags",
+        "description": "description",
+    },
+)
@@ -0,0 +1,23 @@
+"""The Muse API, first three pages. Only if key set."""
+from src.sources import SourceSpec
+
+SPEC = SourceSpec(
+    name="themuse",
+    label="The Muse",
+    urls=("https://www.themuse.com/api/public/jobs",),
+    secret_params={"api_key": "THEMUSE_API_KEY"},
+    requires=("THEMUSE_API_KEY",),
+    page_param="page",
+    pages=3,
+    items="results",
+    rate_limit=(1.0, 1),  # 1s between pages
+    fields={
+        "id": "id",
+        "company": "company.name",
+        "position": "name",
+        "url": "refs.landing_page|url",
+        "published": "publication_date",
+        "tags": "tags",
+        "description": "description",
+    },
+)
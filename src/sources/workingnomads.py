@@ -0,0 +1,19 @@
+"""Working Nomads API. Full list, filter in code; postings have no id, the URL is used."""
+from src.sources import SourceSpec
+
+SPEC = SourceSpec(
+    name="workingnomads",
+    label="Working Nomads",
+    urls=("https://www.workingnomads.com/api/exposed_jobs/",),
+    format="json_stream",
+    conditional=True,
+    fields={
+        "id": "url",
+        "company": "company_name",
+        "position": "title",
+        "url": "url",
+        "published": "pub_date",
+        "tags": "tags",
+        "description": "description",
+    },
+)
@@ -0,0 +1,19 @@
+"""We Work Remotely RSS feeds. Titles are usually "Company Name: Job Title"."""
+from src.sources import SourceSpec
+
+_BASE = "https://weworkremotely.com/categories/"
+
+SPEC = SourceSpec(
+    name="wwr",
+    label="We Work Remotely",
+    urls=(_BASE + "remote-programming-jobs.rss", _BASE + "remote-back-end-programming-jobs.rss"),
+    format="rss",
+    conditional=True,
+    company_in_title=":",
+    fields={
+        "id": "link",
+        "position": "title",
+        "url": "link",
+        "published": "published_parsed",
+    },
+)
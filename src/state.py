@@ -1,19 +1,46 @@
 """
 Track which jobs we have already applied to. Uses applied.json (gitignored or committed in CI).
+
+applied.json is a snapshot; each new record is first appended (and fsynced) to the
+journal applied.jsonl next to it. Loading replays snapshot + journal, and compact()
+folds the journal back into the snapshot.
+
+With STATE_BACKEND=sqlite the same functions read and write applied.db instead
+(see state_db); an existing applied.json is imported on first load, and load_index
+returns a SqliteIndex that answers lookups with indexed queries instead of loading
+the whole history.
 """
 import json
 import logging
-from datetime import datetime
+import os
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 from pathlib import Path
 
+import config
+from src import atomic_file, metrics, state_db
+from src.domain_resolver import slugify
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_STATE_PATH = Path(__file__).resolve().parent.parent / "data" / "applied.json"
 
+# Journal records written since the last compaction, per snapshot path.
+_journal_counts: dict[Path, int] = {}
+_journal_lock = threading.Lock()
 
-def load_applied(state_path: Path | None = None) -> list[dict]:
-    """Load list of applied jobs. Returns [] if file missing or invalid."""
-    path = state_path or DEFAULT_STATE_PATH
+
+def journal_path(state_path: Path) -> Path:
+    """applied.json -> applied.jsonl"""
+    return state_path.with_suffix(".jsonl")
+
+
+def _record_key(record: dict) -> tuple:
+    return (record.get("job_url"), record.get("applied_at"))
+
+
+def _load_snapshot(path: Path) -> list[dict]:
     if not path.exists():
         return []
     try:
@@ -25,21 +52,251 @@ def load_applied(state_path: Path | None = None) -> list[dict]:
         return []
 
 
-def is_applied(job_url: str, applied_list: list[dict]) -> bool:
+def _journal_record(line: bytes, name: str) -> dict | None:
+    if not line.strip():
+        return None
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        logger.warning("Skipping unreadable line in %s", name)
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _load_journal(path: Path) -> list[dict]:
+    """
+    Read journal records. A torn trailing line (crash mid-write) is cut off the file, so
+    the next append starts on a line of its own; if only its newline is missing, it is added.
+    """
+    jpath = journal_path(path)
+    if not jpath.exists():
+        return []
+    try:
+        with open(jpath, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        logger.warning("Could not read %s: %s", jpath.name, e)
+        return []
+    # Everything after the last newline is an unfinished write.
+    end = data.rfind(b"\n") + 1
+    records = [r for r in (_journal_record(line, jpath.name) for line in data[:end].splitlines()) if r is not None]
+    if end == len(data):
+        return records
+    record = _journal_record(data[end:], jpath.name)
+    try:
+        with _journal_lock, open(jpath, "r+b") as f:
+            if record is not None:
+                records.append(record)
+                f.seek(len(data))
+                f.write(b"\n")
+            else:
+                f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+    except OSError as e:
+        logger.warning("Could not repair %s: %s", jpath.name, e)
+    return records
+
+
+def _use_sqlite() -> bool:
+    return config.STATE_BACKEND == "sqlite"
+
+
+def _open_db(path: Path) -> Path:
+    """applied.db for path, importing applied.json (+ journal) into it if it is still empty."""
+    dbp = state_db.db_path(path)
+    if state_db.is_empty(dbp) and (path.exists() or journal_path(path).exists()):
+        state_db.migrate_json(_load_json(path), dbp)
+    return dbp
+
+
+def load_applied(state_path: Path | None = None) -> list[dict]:
+    """Load list of applied jobs (snapshot + journal). Returns [] if nothing valid on disk."""
+    path = state_path or DEFAULT_STATE_PATH
+    if _use_sqlite():
+        return state_db.load_applied(_open_db(path))
+    return _load_json(path)
+
+
+def _load_json(path: Path) -> list[dict]:
+    records = _load_snapshot(path)
+    journal = _load_journal(path)
+    # A crash between writing the snapshot and truncating the journal leaves
+    # records in both; replay only the ones the snapshot does not have.
+    seen = {_record_key(r) for r in records if isinstance(r, dict)}
+    records.extend(r for r in journal if _record_key(r) not in seen)
+    with _journal_lock:
+        _journal_counts[path] = len(journal)
+    return records
+
+
+class ApplicationIndex(ABC):
+    """
+    What a run needs from the applied history: AppliedIndex keeps it in memory (applied.json),
+    SqliteIndex queries applied.db. append_applied and compact accept either.
+    """
+
+    @property
+    @abstractmethod
+    def records(self) -> list[dict]:
+        """Every applied record."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def add(self, record: dict) -> None:
+        """Add one applied record."""
+
+    @abstractmethod
+    def contains(self, job_url: str, source: str = "", job_id: str = "") -> bool:
+        """True if the URL or the (source, job_id) pair was already applied to."""
+
+    @abstractmethod
+    def recently_contacted(self, company: str = "", email: str = "", days: int | None = None) -> bool:
+        """True if the company (by slug) or the email got an application in the last `days` (CONTACT_COOLDOWN_DAYS)."""
+
+
+def _cooldown_start(days: int | None) -> str | None:
+    """applied_at bound for recently_contacted; None when the cool-down is off."""
+    days = config.CONTACT_COOLDOWN_DAYS if days is None else days
+    if days <= 0:
+        return None
+    return (datetime.utcnow() - timedelta(days=days)).isoformat() + "Z"
+
+
+class AppliedIndex(ApplicationIndex):
+    """
+    Applied records plus a set of job URLs and a set of (source, job_id) keys,
+    kept in sync on every add so lookups and inserts are O(1).
+    Also a contact index: last application time per company slug and per recipient email,
+    so a company is not written to again within CONTACT_COOLDOWN_DAYS.
+    """
+
+    def __init__(self, records: list[dict] | None = None) -> None:
+        self._records: list[dict] = []
+        self._urls: set[str] = set()
+        self._keys: set[tuple[str, str]] = set()
+        self._companies: dict[str, str] = {}  # company slug -> last applied_at
+        self._emails: dict[str, str] = {}  # lowercased email -> last applied_at
+        for record in records or []:
+            self.add(record)
+
+    @property
+    def records(self) -> list[dict]:
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record: dict) -> None:
+        """Append one record and index it."""
+        self._records.append(record)
+        url = record.get("job_url")
+        if url:
+            self._urls.add(url)
+        key = _job_key(record.get("source", ""), record.get("job_id", ""))
+        if key:
+            self._keys.add(key)
+        at = record.get("applied_at") or ""
+        slug = slugify(record.get("company") or "")
+        if slug and at >= self._companies.get(slug, ""):
+            self._companies[slug] = at
+        email = (record.get("to_email") or "").strip().lower()
+        if email and at >= self._emails.get(email, ""):
+            self._emails[email] = at
+
+    def has_url(self, job_url: str) -> bool:
+        return job_url in self._urls
+
+    def has_job(self, source: str, job_id: str) -> bool:
+        key = _job_key(source, job_id)
+        return key is not None and key in self._keys
+
+    def contains(self, job_url: str, source: str = "", job_id: str = "") -> bool:
+        return self.has_url(job_url) or self.has_job(source, job_id)
+
+    def recently_contacted(self, company: str = "", email: str = "", days: int | None = None) -> bool:
+        since = _cooldown_start(days)
+        if since is None:
+            return False
+        slug = slugify(company)
+        if slug and slug in self._companies and self._companies[slug] >= since:
+            return True
+        email = (email or "").strip().lower()
+        return bool(email) and email in self._emails and self._emails[email] >= since
+
+
+class SqliteIndex(ApplicationIndex):
+    """
+    The applied history in applied.db (STATE_BACKEND=sqlite): every lookup is an indexed
+    query and add() inserts the row, so nothing is loaded into memory.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+
+    @property
+    def records(self) -> list[dict]:
+        return state_db.load_applied(self.db_path)
+
+    def __len__(self) -> int:
+        return state_db.count(self.db_path)
+
+    def add(self, record: dict) -> None:
+        state_db.append_applied(record, self.db_path)
+
+    def contains(self, job_url: str, source: str = "", job_id: str = "") -> bool:
+        if job_url and state_db.has_applied(self.db_path, job_url):
+            return True
+        return _job_key(source, job_id) is not None and state_db.has_job(self.db_path, source, job_id)
+
+    def recently_contacted(self, company: str = "", email: str = "", days: int | None = None) -> bool:
+        since = _cooldown_start(days)
+        if since is None:
+            return False
+        if slugify(company) and state_db.has_contacted_company(self.db_path, company, since):
+            return True
+        return bool((email or "").strip()) and state_db.has_contacted_email(self.db_path, email, since)
+
+
+def _job_key(source: str, job_id) -> tuple[str, str] | None:
+    job_id = str(job_id or "")
+    if not source or not job_id:
+        return None
+    return (source, job_id)
+
+
+def load_index(state_path: Path | None = None) -> ApplicationIndex:
+    """Load applied.json into an AppliedIndex (SQLite backend: a SqliteIndex querying applied.db)."""
+    path = state_path or DEFAULT_STATE_PATH
+    if _use_sqlite():
+        return SqliteIndex(_open_db(path))
+    return AppliedIndex(load_applied(path))
+
+
+def is_applied(job_url: str, applied_list: list[dict] | ApplicationIndex) -> bool:
     """True if job_url is already in the applied list."""
+    if isinstance(applied_list, ApplicationIndex):
+        return applied_list.contains(job_url)
     urls = {r.get("job_url") for r in applied_list if r.get("job_url")}
     return job_url in urls
 
 
+@metrics.timed("state_write_seconds", op="append")
 def append_applied(
     source: str,
     job_id: str,
     job_url: str,
     company: str,
-    applied_list: list[dict],
+    applied_list: list[dict] | ApplicationIndex,
     state_path: Path | None = None,
+    to_email: str = "",
 ) -> None:
-    """Append one record and write back atomically."""
+    """
+    Append one record (to a list or an ApplicationIndex) and to the journal, fsynced.
+    Every STATE_COMPACT_EVERY records the journal is compacted into applied.json.
+    """
     path = state_path or DEFAULT_STATE_PATH
     record = {
         "source": source,
@@ -48,16 +305,49 @@ def append_applied(
         "company": company,
         "applied_at": datetime.utcnow().isoformat() + "Z",
     }
-    applied_list.append(record)
+    if to_email:
+        record["to_email"] = to_email
+    if isinstance(applied_list, SqliteIndex):
+        applied_list.add(record)  # inserts the row
+        return
+    if isinstance(applied_list, ApplicationIndex):
+        applied_list.add(record)
+    else:
+        applied_list.append(record)
+    if _use_sqlite():
+        state_db.append_applied(record, state_db.db_path(path))
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(".json.tmp")
-    try:
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(applied_list, f, indent=2, ensure_ascii=False)
-        tmp.replace(path)
-    finally:
-        if tmp.exists():
-            try:
-                tmp.unlink()
-            except OSError:
-                pass
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _journal_lock:
+        with open(journal_path(path), "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        count = _journal_counts.get(path, 0) + 1
+        _journal_counts[path] = count
+    if count >= config.STATE_COMPACT_EVERY:
+        compact(applied_list, path)
+
+
+@metrics.timed("state_write_seconds", op="compact")
+def compact(applied_list: list[dict] | ApplicationIndex, state_path: Path | None = None) -> None:
+    """
+    Write all records to applied.json atomically, then empty the journal.
+    SQLite backend: checkpoint the WAL and close the database.
+    """
+    path = state_path or DEFAULT_STATE_PATH
+    if _use_sqlite():
+        state_db.close(state_db.db_path(path))
+        return
+    records = applied_list.records if isinstance(applied_list, ApplicationIndex) else applied_list
+    with _journal_lock:
+        jpath = journal_path(path)
+        if not jpath.exists() or jpath.stat().st_size == 0:
+            return
+        atomic_file.write_json(path, records, indent=2)
+        with open(jpath, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        _journal_counts[path] = 0
+
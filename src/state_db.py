@@ -0,0 +1,200 @@
+"""
+SQLite backend for applied state (STATE_BACKEND=sqlite). Indexed tables for applications,
+contacted emails and contacted companies; WAL mode so readers never block the writer.
+"""
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+from src.domain_resolver import slugify
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    job_url TEXT NOT NULL,
+    company TEXT NOT NULL,
+    to_email TEXT NOT NULL DEFAULT '',
+    applied_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_applications_url ON applications (job_url);
+CREATE INDEX IF NOT EXISTS ix_applications_source_job ON applications (source, job_id);
+CREATE TABLE IF NOT EXISTS contacted_emails (
+    email TEXT PRIMARY KEY,
+    company TEXT NOT NULL,
+    first_contacted_at TEXT NOT NULL,
+    last_contacted_at TEXT NOT NULL,
+    times INTEGER NOT NULL DEFAULT 1
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS contacted_companies (
+    company_slug TEXT PRIMARY KEY,
+    company TEXT NOT NULL,
+    first_contacted_at TEXT NOT NULL,
+    last_contacted_at TEXT NOT NULL,
+    times INTEGER NOT NULL DEFAULT 1
+) WITHOUT ROWID;
+"""
+
+_connections: dict[Path, sqlite3.Connection] = {}
+_lock = threading.RLock()
+
+
+def db_path(state_path: Path) -> Path:
+    """applied.json -> applied.db"""
+    return state_path.with_suffix(".db")
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Return the shared connection for path, creating the schema on first use."""
+    with _lock:
+        conn = _connections.get(path)
+        if conn is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.executescript(SCHEMA)
+            _connections[path] = conn
+        return conn
+
+
+def close(path: Path) -> None:
+    """Checkpoint the WAL into the main file and close, so applied.db is self-contained."""
+    with _lock:
+        conn = _connections.pop(path, None)
+        if conn is None:
+            return
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+
+
+def _insert(conn: sqlite3.Connection, record: dict) -> bool:
+    cur = conn.execute(
+        "INSERT OR IGNORE INTO applications (source, job_id, job_url, company, to_email, applied_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            record.get("source") or "",
+            str(record.get("job_id") or ""),
+            record.get("job_url") or "",
+            record.get("company") or "",
+            record.get("to_email") or "",
+            record.get("applied_at") or "",
+        ),
+    )
+    if cur.rowcount == 0:
+        return False
+    at = record.get("applied_at") or ""
+    email = (record.get("to_email") or "").lower()
+    if email:
+        conn.execute(
+            "INSERT INTO contacted_emails (email, company, first_contacted_at, last_contacted_at) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (email) DO UPDATE SET "
+            "last_contacted_at = MAX(last_contacted_at, excluded.last_contacted_at), times = times + 1",
+            (email, record.get("company") or "", at, at),
+        )
+    slug = slugify(record.get("company") or "")
+    if slug:
+        conn.execute(
+            "INSERT INTO contacted_companies (company_slug, company, first_contacted_at, last_contacted_at) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (company_slug) DO UPDATE SET "
+            "last_contacted_at = MAX(last_contacted_at, excluded.last_contacted_at), times = times + 1",
+            (slug, record.get("company") or "", at, at),
+        )
+    return True
+
+
+def load_applied(path: Path) -> list[dict]:
+    """All applications, oldest first, in the same shape as applied.json records."""
+    rows = connect(path).execute(
+        "SELECT source, job_id, job_url, company, to_email, applied_at FROM applications ORDER BY id"
+    )
+    records = []
+    for row in rows:
+        record = dict(row)
+        if not record["to_email"]:
+            del record["to_email"]
+        records.append(record)
+    return records
+
+
+def append_applied(record: dict, path: Path) -> None:
+    """Insert one application and update the contact tables in one transaction."""
+    conn = connect(path)
+    with _lock:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            _insert(conn, record)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def _exists(path: Path, sql: str, params: tuple) -> bool:
+    conn = connect(path)
+    with _lock:
+        return conn.execute(sql, params).fetchone() is not None
+
+
+def has_applied(path: Path, job_url: str) -> bool:
+    return _exists(path, "SELECT 1 FROM applications WHERE job_url = ?", (job_url,))
+
+
+def has_job(path: Path, source: str, job_id: str) -> bool:
+    return _exists(path, "SELECT 1 FROM applications WHERE source = ? AND job_id = ?", (source, str(job_id)))
+
+
+def has_contacted_email(path: Path, email: str, since: str = "") -> bool:
+    """True if email got an application (at or after `since`, an ISO timestamp, when given)."""
+    return _exists(
+        path,
+        "SELECT 1 FROM contacted_emails WHERE email = ? AND last_contacted_at >= ?",
+        ((email or "").strip().lower(), since),
+    )
+
+
+def has_contacted_company(path: Path, company: str, since: str = "") -> bool:
+    """True if the company (by slug) got an application (at or after `since`, when given)."""
+    return _exists(
+        path,
+        "SELECT 1 FROM contacted_companies WHERE company_slug = ? AND last_contacted_at >= ?",
+        (slugify(company), since),
+    )
+
+
+def count(path: Path) -> int:
+    conn = connect(path)
+    with _lock:
+        return conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+
+
+def is_empty(path: Path) -> bool:
+    return not _exists(path, "SELECT 1 FROM applications LIMIT 1", ())
+
+
+def migrate_json(records: list[dict], path: Path) -> int:
+    """
+    One-shot import of applied.json records into an empty database.
+    Returns the number of rows imported (0 if the database already had data).
+    """
+    conn = connect(path)
+    with _lock:
+        if not is_empty(path):
+            return 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            imported = sum(1 for r in records if isinstance(r, dict) and _insert(conn, r))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    logger.info("Migrated %d applied records from JSON into %s", imported, path.name)
+    return imported
+
@@ -1,41 +1,186 @@
 """
-Send Telegram report after each application. No-op if TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID missing.
+Send Telegram reports. No-op if TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID missing.
+
+Reporter sends from a background thread so the pipeline never waits on Telegram:
+reports arriving close together are merged into one message (up to Telegram's 4096
+characters), sends go through the per-host rate limiter, and 429/5xx/network errors are
+retried with backoff (honouring retry_after). close() posts the run digest and waits.
 """
 import logging
-import requests
+import queue
+import threading
+import time
+from urllib.parse import urlparse
 
 import config
+from src import http_client, metrics, rate_limit
 
 logger = logging.getLogger(__name__)
 
+MAX_MESSAGE_LENGTH = 4096
+# Wait this long after a report for more to arrive before sending them as one message.
+BATCH_WINDOW = 2.0
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+_STOP = object()
+
+
+def _api_url(method: str) -> str:
+    return f"{config.TELEGRAM_API_BASE}/bot{config.TELEGRAM_BOT_TOKEN}/{method}"
+
+
+def format_report(position: str, company: str, job_url: str, to_email: str = "", source: str = "") -> str:
+    text = f"Applied: {position} @ {company} – {job_url}"
+    if to_email:
+        text += f"\nEmail: {to_email}"
+    if source:
+        text += f"\nSource: {source}"
+    return text
+
+
+def send_message(text: str, retries: int = MAX_RETRIES) -> bool:
+    """
+    Send one message to the configured chat, retrying 429 (after retry_after), 5xx and
+    network errors with exponential backoff. Returns True on success. Does not raise.
+    """
+    url = _api_url("sendMessage")
+    host = urlparse(url).hostname or ""
+    for attempt in range(retries + 1):
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt)
+        try:
+            rate_limit.wait(host)
+            with metrics.timer("telegram_request_seconds"):
+                r = http_client.post(url, data={"chat_id": config.TELEGRAM_CHAT_ID, "text": text})
+            if r.ok:
+                metrics.inc("telegram_messages_total", outcome="sent")
+                return True
+            if r.status_code != 429 and r.status_code < 500:
+                logger.warning("Telegram API error: %s %s", r.status_code, r.text[:200])
+                metrics.inc("telegram_messages_total", outcome="failed")
+                return False
+            if r.status_code == 429:
+                try:
+                    delay = float(r.json().get("parameters", {}).get("retry_after", delay))
+                except (ValueError, AttributeError):
+                    pass
+            error = f"{r.status_code} {r.text[:200]}"
+        except Exception as e:
+            error = str(e)
+        if attempt < retries:
+            metrics.inc("telegram_retries_total")
+            logger.info("Telegram send failed (%s), retrying in %.0fs", error, delay)
+            time.sleep(delay)
+        else:
+            logger.warning("Telegram send failed after %d attempts: %s", retries + 1, error)
+    metrics.inc("telegram_messages_total", outcome="failed")
+    return False
+
 
 def send_telegram_report(
     position: str, company: str, job_url: str, to_email: str = "", source: str = ""
 ) -> bool:
     """
     Send one message to the configured Telegram chat: "Applied: [position] @ [company] – [job url]" plus email and source.
-    Returns True on success, False otherwise. Does not raise.
+    Blocks until sent; Reporter does the same in the background. Returns True on success. Does not raise.
     """
-    if not config.TELEGRAM_BOT_TOKEN or not config.TELEGRAM_CHAT_ID:
+    if not config.telegram_configured():
         logger.debug("Telegram report skipped (token or chat_id not set)")
         return False
-    text = f"Applied: {position} @ {company} – {job_url}"
-    if to_email:
-        text += f"\nEmail: {to_email}"
-    if source:
-        text += f"\nSource: {source}"
-    url = f"https://api.telegram.org/bot{config.TELEGRAM_BOT_TOKEN}/sendMessage"
-    try:
-        r = requests.post(
-            url,
-            data={"chat_id": config.TELEGRAM_CHAT_ID, "text": text},
-            timeout=10,
-        )
-        if r.ok:
-            logger.info("Telegram report sent")
-            return True
-        logger.warning("Telegram API error: %s %s", r.status_code, r.text[:200])
-        return False
-    except Exception as e:
-        logger.warning("Telegram send failed: %s", e)
-        return False
+    if send_message(format_report(position, company, job_url, to_email, source)):
+        logger.info("Telegram report sent")
+        return True
+    return False
+
+
+def _pack(texts: list[str]) -> list[str]:
+    """Join reports into as few messages as fit MAX_MESSAGE_LENGTH (one report never split)."""
+    messages, current = [], ""
+    for text in texts:
+        text = text[:MAX_MESSAGE_LENGTH]
+        if current and len(current) + 2 + len(text) > MAX_MESSAGE_LENGTH:
+            messages.append(current)
+            current = ""
+        current = f"{current}\n\n{text}" if current else text
+    if current:
+        messages.append(current)
+    return messages
+
+
+class Reporter:
+    """Background, batching Telegram reporter for one run."""
+
+    def __init__(self, batch_window: float | None = None) -> None:
+        self.batch_window = BATCH_WINDOW if batch_window is None else batch_window
+        self.enabled = config.telegram_configured()
+        self.sent = 0
+        self.failed = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        if self.enabled:
+            self._thread = threading.Thread(target=self._run, name="telegram", daemon=True)
+            self._thread.start()
+
+    def report(self, position: str, company: str, job_url: str, to_email: str = "", source: str = "") -> None:
+        """Queue an application report; returns immediately."""
+        if self.enabled:
+            self._queue.put(format_report(position, company, job_url, to_email, source))
+
+    def post(self, text: str) -> None:
+        """Queue any text (e.g. the run digest)."""
+        if self.enabled and text:
+            self._queue.put(text)
+
+    def close(self, timeout: float | None = 120) -> None:
+        """Send what is queued, then stop the worker (waits at most timeout seconds)."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Telegram reporter still busy after %ss, %d reports dropped", timeout, self._queue.qsize())
+        self._thread = None
+
+    def _take_batch(self) -> tuple[list[str], bool]:
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.batch_window
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=max(0.0, remaining)) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            batch, stopped = self._take_batch()
+            for message in _pack(batch):
+                if send_message(message):
+                    self.sent += 1
+                else:
+                    self.failed += 1
+        logger.info("Telegram reporter done: %d messages sent, %d failed", self.sent, self.failed)
+
+
+def format_digest(summary: dict) -> str:
+    """
+    Run digest from Pipeline.summary(): {"applied", "cap", "discovered",
+    "skipped": {reason: n}, "timings": {stage: seconds}}.
+    """
+    lines = [f"Run digest: applied to {summary.get('applied', 0)} jobs (cap {summary.get('cap', 0)})"]
+    lines.append(f"Jobs discovered: {summary.get('discovered', 0)}")
+    skipped = summary.get("skipped") or {}
+    if skipped:
+        lines.append("Skipped: " + ", ".join(f"{reason} {n}" for reason, n in sorted(skipped.items())))
+    timings = summary.get("timings") or {}
+    if timings:
+        lines.append("Stage time: " + ", ".join(f"{stage} {secs:.1f}s" for stage, secs in timings.items()))
+    return "\n".join(lines)
@@ -0,0 +1,87 @@
+"""
+Pipeline ordering: with ranking on, the per-run cap goes to the best jobs, not the first to arrive.
+Sent applications are recorded even when reporting them fails.
+"""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import config
+from src import pipeline, state
+from src.models import Job
+
+
+class _Smtp:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    def send(self, to_email: str, company_name: str, job_position: str) -> bool:
+        self.sent.append(company_name)
+        return True
+
+
+class _Reporter:
+    def report(self, *args) -> None:
+        pass
+
+    def post(self, text: str) -> None:
+        pass
+
+
+class _FailingReporter(_Reporter):
+    def report(self, *args) -> None:
+        raise RuntimeError("reporter down")
+
+
+def _jobs(prefix: str, n: int, match_score: int) -> list[Job]:
+    return [
+        Job("remotive", f"{prefix}{i}", f"{prefix} Company {i}", "Java Developer",
+            f"https://example.com/{prefix}/{i}", match_score=match_score)
+        for i in range(n)
+    ]
+
+
+def _email(company: str) -> str:
+    return f"jobs@{company.replace(' ', '').lower()}.example"
+
+
+class RankedPipelineTest(unittest.TestCase):
+    def run_pipeline(
+        self, jobs: list[Job], cap: int, factor: int, reporter: _Reporter | None = None
+    ) -> tuple[list[str], state.AppliedIndex]:
+        smtp = _Smtp()
+        applied = state.AppliedIndex()
+
+        def iter_jobs(stop=None, seen=None):
+            yield from jobs
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.multiple(
+            config, RANK_TOP_K_FACTOR=factor, PIPELINE_RESOLVE_WORKERS=1, HUNTER_API_KEY="", STATE_BACKEND="json"
+        ), mock.patch.object(pipeline.job_discovery, "iter_jobs", iter_jobs), mock.patch.object(
+            pipeline.email_finder, "find_email_for_company", _email
+        ):
+            summary = pipeline.run(applied, Path(tmp) / "applied.json", smtp, cap, reporter=reporter or _Reporter())
+        self.assertEqual(summary["applied"], len(smtp.sent))
+        return smtp.sent, applied
+
+    def test_strong_jobs_after_weak_ones_get_the_cap(self):
+        weak, strong = _jobs("weak", 40, 1), _jobs("strong", 10, 20)
+        sent, _ = self.run_pipeline(weak + strong, cap=10, factor=3)
+        self.assertEqual(sorted(sent), sorted(job.company for job in strong))
+
+    def test_without_ranking_jobs_go_in_arrival_order(self):
+        weak, strong = _jobs("weak", 40, 1), _jobs("strong", 10, 20)
+        sent, _ = self.run_pipeline(weak + strong, cap=10, factor=0)
+        self.assertEqual(sent, [job.company for job in weak[:10]])
+
+    def test_failed_reports_do_not_lose_records(self):
+        jobs = _jobs("job", 5, 10)
+        sent, applied = self.run_pipeline(jobs, cap=5, factor=0, reporter=_FailingReporter())
+        self.assertEqual(len(sent), 5)
+        for job in jobs:
+            self.assertTrue(applied.contains(job.url, job.source, job.id))
+
+
+if __name__ == "__main__":
+    unittest.main()